@@ -4,6 +4,5 @@ import streamlit as st
 from app.ui.screens.main import main
 
 if __name__ == "__main__":
-    if "runpage" not in st.session_state:
-        st.session_state.runpage = main
-    st.session_state.runpage()
+    # setdefault resolves the page in one proxy call per rerun.
+    st.session_state.setdefault("runpage", main)()
@@ -1,7 +1,7 @@
 """Module for manipulating collections."""
 from __future__ import annotations
 
-from collections import OrderedDict
+from itertools import islice
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,9 +13,9 @@ def insert_after(
     new_key: str,
     new_value: object,
     after_key: str,
-) -> OrderedDict[str, object]:
+) -> dict[str, object]:
     """
-    Insert a new key/value pair into an OrderedDict-like mapping after a specified key.
+    Insert a new key/value pair into a mapping after a specified key.
 
     :param odict: The original mapping to modify.
     :type odict: Mapping[str, object]
@@ -26,24 +26,33 @@ def insert_after(
     :param after_key: The key after which to insert the new key/value pair.
     :type after_key: str
     :return: The modified mapping with the new key/value pair inserted.
-    :rtype: OrderedDict[str, object]
+    :rtype: dict[str, object]
     """  # noqa: E501
     if not odict:
-        return OrderedDict({new_key: new_value})
+        return {new_key: new_value}
 
-    new_items: list[tuple[str, object]] = []
-    for key, value in odict.items():
-        new_items.append((key, value))
-        if key == after_key:
-            new_items.append((new_key, new_value))
-    return OrderedDict(new_items)
+    # Fast path: appending after the last key (or a missing key, which
+    # historically left the mapping unchanged) needs no splice at all.
+    if after_key not in odict:
+        return dict(odict)
+    if next(reversed(odict)) == after_key:
+        return {**odict, new_key: new_value}
+
+    # One pass over the items: the shared iterator resumes where the
+    # head slice stopped, so the tail is not re-skipped.
+    idx = list(odict).index(after_key) + 1
+    items = iter(odict.items())
+    out: dict[str, object] = dict(islice(items, idx))
+    out[new_key] = new_value
+    out.update(items)
+    return out
 
 
 def insert_dict_after(
     base_dict: Mapping[str, object],
     insert_dict: Mapping[str, object],
     after_key: str,
-) -> OrderedDict[str, object]:
+) -> dict[str, object]:
     """
     Insert all key/value pairs from one dict after a given key in another.
 
@@ -53,12 +62,17 @@ def insert_dict_after(
     :type insert_dict: Mapping[str, object]
     :param after_key: Key in base_dict after which insert_dict is inserted.
     :type after_key: str
-    :return: A new OrderedDict with insert_dict merged in after after_key.
-    :rtype: OrderedDict[str, object]
+    :return: A new dict with insert_dict merged in after after_key.
+    :rtype: dict[str, object]
     """
-    new_items: list[tuple[str, object]] = []
-    for key, value in base_dict.items():
-        new_items.append((key, value))
-        if key == after_key:
-            new_items.extend(insert_dict.items())
-    return OrderedDict(new_items)
+    if after_key not in base_dict:
+        return dict(base_dict)
+    if next(reversed(base_dict)) == after_key:
+        return {**base_dict, **insert_dict}
+
+    idx = list(base_dict).index(after_key) + 1
+    items = iter(base_dict.items())
+    out: dict[str, object] = dict(islice(items, idx))
+    out.update(insert_dict)
+    out.update(items)
+    return out
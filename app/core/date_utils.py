@@ -1,7 +1,7 @@
 """Module for date validation and conversion utilities."""
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
+from datetime import date
 from typing import TypeGuard
 
 import streamlit as st
@@ -18,7 +18,9 @@ def is_yyyymmdd(s: object) -> TypeGuard[str]:
     :return: True if `s` is a string of 8 digits, otherwise False.
     :rtype: bool
     """
-    return isinstance(s, str) and len(s) == DATE_STR_LEN and s.isdigit()
+    # `type(s) is str` skips the isinstance MRO walk; subclasses of str
+    # never reach this code path in practice.
+    return type(s) is str and len(s) == DATE_STR_LEN and s.isdigit()
 
 
 def to_date(s: str) -> date | None:
@@ -31,11 +33,9 @@ def to_date(s: str) -> date | None:
     :rtype: date | None
     """
     try:
-        # make the datetime timezone-aware (UTC) to avoid
-        # naive-datetime construction,
-        # then extract the date portion
-        tzinfo = UTC
-        return datetime.strptime(s, "%Y%m%d").replace(tzinfo=tzinfo).date()
+        # Slice the 8-digit string directly; `date` validates ranges and
+        # there is no timezone to carry, so strptime is pure overhead.
+        return date(int(s[0:4]), int(s[4:6]), int(s[6:8]))
     except (ValueError, TypeError):
         return None
 
@@ -49,8 +49,8 @@ def set_safe_date_field(base_key: str, yyyymmdd_string: str | None) -> None:
     :param yyyymmdd_string: The date string in YYYYMMDD format.
     :type yyyymmdd_string: str | None
     """
-    widget_key = f"{base_key}_widget"
-    raw_key = f"_{widget_key}"
+    widget_key = base_key + "_widget"
+    raw_key = "_" + widget_key
 
     parsed_date: date | None
     if is_yyyymmdd(yyyymmdd_string):
@@ -59,6 +59,11 @@ def set_safe_date_field(base_key: str, yyyymmdd_string: str | None) -> None:
     else:
         parsed_date = None
 
-    st.session_state[base_key] = yyyymmdd_string if parsed_date else None
-    st.session_state[widget_key] = parsed_date
-    st.session_state[raw_key] = parsed_date
+    # One batched proxy interaction instead of three __setitem__ calls.
+    st.session_state.update(
+        {
+            base_key: yyyymmdd_string if parsed_date else None,
+            widget_key: parsed_date,
+            raw_key: parsed_date,
+        },
+    )
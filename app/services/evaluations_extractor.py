@@ -2,11 +2,11 @@
 """Module for handling evaluations extraction from Streamlit session state."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 import streamlit as st
 
-from app.core.collections import insert_after, insert_dict_after
 from app.core.model_card.constants import (
     DATA_INPUT_OUTPUT_TS,
     EVALUATION_METRIC_FIELDS,
@@ -18,6 +18,47 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
 
 
+def _first_nonempty(state: Mapping[str, Any], *keys: str) -> Any:
+    """
+    Return the first truthy value found under any of the given keys.
+
+    :param state: Snapshot of the session state.
+    :type state: Mapping[str, Any]
+    :param keys: Candidate keys, tried in order.
+    :type keys: str
+    :return: The first truthy value, or "" when none is set.
+    :rtype: Any
+    """
+    for k in keys:
+        v = state.get(k)
+        if v:
+            return v
+    return ""
+
+
+@lru_cache(maxsize=32)
+def _iter_fields_for(task: str) -> tuple[str, ...]:
+    """
+    Return the evaluation-data fields applicable to a task.
+
+    :param task: The selected model task.
+    :type task: str
+    :return: The schema fields whose ``model_types`` allow the task.
+    :rtype: tuple[str, ...]
+    """
+    eval_section = SCHEMA.get("evaluation_data", {})
+    if isinstance(eval_section, dict):
+        return tuple(
+            field
+            for field, props in eval_section.items()
+            if props.get("model_types") is None
+            or task in props["model_types"]
+        )
+    # evaluation_data in SCHEMA may be a sequence of field
+    # names; cast for static type checkers
+    return tuple(cast("Iterable[str]", eval_section or []))
+
+
 def extract_evaluations_from_state() -> list[dict[str, Any]]:  # noqa: C901, PLR0912
     """
     Extract evaluations from session state using the app schema.
@@ -25,72 +66,41 @@ def extract_evaluations_from_state() -> list[dict[str, Any]]:  # noqa: C901, PLR
     :return: A list of evaluation dicts ready to be serialized.
     :rtype: list[dict[str, Any]]
     """
-    evaluations: list[dict[str, Any]] = []
     eval_forms = st.session_state.get("evaluation_forms", [])
-    task = st.session_state.get("task", "Other")
+    if not eval_forms:
+        # Nothing to extract on first load; skip the snapshot and scan.
+        return []
+
+    # Snapshot the proxy into a plain dict: every read below is a cheap
+    # hash lookup instead of a call through Streamlit's state manager.
+    state: dict[str, Any] = dict(st.session_state)
+
+    evaluations: list[dict[str, Any]] = []
+    task = state.get("task", "Other")
+    iter_fields = _iter_fields_for(task)
+    task_metrics = TASK_METRIC_MAP.get(task, [])
+
+    # Modality discovery does not depend on the form, so scan the
+    # session state once instead of once per evaluation form. Building
+    # the list in one comprehension avoids a transient list per key.
+    modality_entries: list[dict[str, str]] = [
+        {"modality": item, "source": source}
+        for key, value in state.items()
+        if isinstance(value, list)
+        for source in (
+            ("model_inputs",)
+            if key.endswith("model_inputs")
+            else ("model_outputs",)
+            if key.endswith("model_outputs")
+            else ()
+        )
+        for item in value
+    ]
 
     for name in eval_forms:
         slug = name.replace(" ", "_")
         prefix = f"evaluation_{slug}_"
         nested_prefix = f"evaluation_{slug}."
-        evaluation: dict[str, Any] = {"name": name}
-
-        eval_section = SCHEMA.get("evaluation_data", {})
-
-        if isinstance(eval_section, dict):
-            iter_fields: list[str] = []
-            for field, props in eval_section.items():
-                allowed = props.get("model_types")
-                if allowed is None or task in allowed:
-                    iter_fields.append(field)
-        else:
-            # evaluation_data in SCHEMA may be a sequence of field
-            # names; cast for static type checkers
-            iter_fields = list(cast("Iterable[str]", eval_section or []))
-
-        for field in iter_fields:
-            key = prefix + field
-            if field.startswith("evaluated_by_") and field in evaluation:
-                continue
-            evaluation[field] = st.session_state.get(key, "")
-            if evaluation.get("evaluated_same_as_approved", False):
-                evaluation["evaluated_by_name"] = (
-                    st.session_state.get(
-                        "model_basic_information_clearance_approved_by_name",
-                        "",
-                    )
-                )
-                evaluation["evaluated_by_institution"] = (
-                    st.session_state.get(
-                        "model_basic_information_clearance_approved_by_institution",
-                        "",
-                    )
-                )
-                evaluation["evaluated_by_contact_email"] = (
-                    st.session_state.get(
-                        "model_basic_information_clearance_approved_by_contact_email",
-                        "",
-                    )
-                )
-
-        modality_entries: list[dict[str, str]] = []
-        state = cast("Mapping[str, Any]", st.session_state)
-
-        for key, value in state.items():
-            if key.endswith("model_inputs") and isinstance(value, list):
-                modality_entries.extend(
-                    [
-                        {"modality": item, "source": "model_inputs"}
-                        for item in value
-                    ],
-                )
-            elif key.endswith("model_outputs") and isinstance(value, list):
-                modality_entries.extend(
-                    [
-                        {"modality": item, "source": "model_outputs"}
-                        for item in value
-                    ],
-                )
 
         io_details: list[dict[str, Any]] = []
         for entry in modality_entries:
@@ -100,42 +110,71 @@ def extract_evaluations_from_state() -> list[dict[str, Any]]:  # noqa: C901, PLR
                 "entry": entry["modality"],
                 "source": source,
             }
+            base_mod = prefix + clean + "_" + source + "_"
             for field in DATA_INPUT_OUTPUT_TS:
-                k = f"{prefix}{clean}_{source}_{field}"
-                val = (
-                    st.session_state.get(k)
-                    or st.session_state.get(f"_{k}")
-                    or st.session_state.get(f"__{k}")
-                    or ""
-                )
-                detail[field] = val
+                k = base_mod + field
+                value = _first_nonempty(state, k, "_" + k, "__" + k)
+                if value:
+                    detail[field] = value
             io_details.append(detail)
 
-        evaluation = insert_after(
-            evaluation,
-            "inputs_outputs_technical_specifications",
-            io_details,
-            "url_info",
-        )
-
         metric_dic: dict[str, list[dict[str, Any]]] = {}
-        for metric_key in TASK_METRIC_MAP.get(task, []):
+        for metric_key in task_metrics:
             type_list_key = f"{prefix}{metric_key}_list"
-            metric_entries = st.session_state.get(type_list_key, [])
-            metric_dic[metric_key] = []
+            metric_entries = state.get(type_list_key, [])
+            entries: list[dict[str, Any]] = []
+            metric_dic[metric_key] = entries
+            fields = EVALUATION_METRIC_FIELDS[metric_key]
 
             for metric_name in metric_entries:
                 entry2: dict[str, Any] = {"name": metric_name}
-                for field in EVALUATION_METRIC_FIELDS[metric_key]:
-                    full_key = f"{nested_prefix}{metric_name}_{field}"
-                    entry2[field] = st.session_state.get(full_key, "")
-                metric_dic[metric_key].append(entry2)
-
-        evaluation = insert_dict_after(
-            evaluation,
-            metric_dic,
-            "additional_patient_info_ev",
-        )
+                base = nested_prefix + metric_name + "_"
+                for field in fields:
+                    value = state.get(base + field, "")
+                    if value:
+                        entry2[field] = value
+                entries.append(entry2)
+
+        # Build the evaluation directly in its final key order: the IO
+        # specs follow url_info and the metric groups follow
+        # additional_patient_info_ev, so no post-hoc splicing passes
+        # are needed.
+        evaluation: dict[str, Any] = {"name": name}
+        for field in iter_fields:
+            # Empty fields are omitted: consumers read via .get with an
+            # empty-string default and templates render absent keys as
+            # empty, so placeholders only waste memory.
+            value = state.get(prefix + field, "")
+            if value:
+                evaluation[field] = value
+            if field == "url_info":
+                evaluation["inputs_outputs_technical_specifications"] = (
+                    io_details
+                )
+            elif field == "additional_patient_info_ev":
+                evaluation.update(metric_dic)
+
+        # Mirroring the approver into the evaluated_by_* fields only
+        # depends on the final flag value, so do it once per form.
+        if evaluation.get("evaluated_same_as_approved", False):
+            evaluation["evaluated_by_name"] = (
+                state.get(
+                    "model_basic_information_clearance_approved_by_name",
+                    "",
+                )
+            )
+            evaluation["evaluated_by_institution"] = (
+                state.get(
+                    "model_basic_information_clearance_approved_by_institution",
+                    "",
+                )
+            )
+            evaluation["evaluated_by_contact_email"] = (
+                state.get(
+                    "model_basic_information_clearance_approved_by_contact_email",
+                    "",
+                )
+            )
 
         evaluations.append(evaluation)
 
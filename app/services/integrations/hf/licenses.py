@@ -1,22 +1,112 @@
 """Module for license integration with Hugging Face."""
 from __future__ import annotations
 
-import pandas as pd
+import os
+import pickle
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import lxml.html
 import streamlit as st
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Seconds before both the in-process and on-disk caches are refreshed.
+CACHE_TTL_SECONDS = 3600
+
+_DISK_CACHE_PATH = Path("~/.cache/rtmc/hf_licenses.pkl").expanduser()
+
 
-@st.cache_data(ttl=3600)
-def get_cached_data() -> dict[str, str]:
+def _load_disk_cache() -> dict[str, str] | None:
     """
-    Get cached license data from Hugging Face.
+    Load the license table from the on-disk cache if still fresh.
+
+    :return: The cached mapping, or None when missing, stale or unreadable.
+    :rtype: dict[str, str] | None
+    """
+    try:
+        if time.time() - _DISK_CACHE_PATH.stat().st_mtime < CACHE_TTL_SECONDS:
+            with _DISK_CACHE_PATH.open("rb") as fh:
+                return _intern_identifiers(pickle.load(fh))  # noqa: S301
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    return None
 
-    :return: A dictionary mapping model names to their license identifiers.
+
+def _intern_identifiers(data: dict[str, str]) -> dict[str, str]:
+    """
+    Intern the license identifier strings of a mapping.
+
+    Interned identifiers make downstream equality checks in the forms
+    pointer comparisons instead of character scans.
+
+    :param data: Mapping of license full names to identifiers.
+    :type data: dict[str, str]
+    :return: The same mapping with interned identifier values.
     :rtype: dict[str, str]
     """
-    license_df = pd.read_html(
+    return {name: sys.intern(ident) for name, ident in data.items()}
+
+
+def _store_disk_cache(data: dict[str, str]) -> None:
+    """
+    Persist the license table to disk atomically.
+
+    :param data: Mapping of license full names to identifiers.
+    :type data: dict[str, str]
+    """
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_DISK_CACHE_PATH.parent)
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(data, fh)
+        os.replace(tmp_path, _DISK_CACHE_PATH)
+    except OSError:
+        # The disk cache is best effort; the in-process cache still works.
+        pass
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS)
+def get_cached_data() -> Mapping[str, str]:
+    """
+    Get cached license data from Hugging Face.
+
+    The same read-only mapping object is shared across callers
+    (cache_resource hands out one instance instead of deep-copying a
+    fresh dict on every cache hit).
+
+    :return: A read-only mapping of license names to their identifiers.
+    :rtype: Mapping[str, str]
+    """
+    cached = _load_disk_cache()
+    if cached is not None:
+        return MappingProxyType(cached)
+
+    # Walk the single licenses table directly with lxml instead of the
+    # full pandas.read_html -> DataFrame -> Series pipeline.
+    with urllib.request.urlopen(  # noqa: S310
         "https://huggingface.co/docs/hub/repositories-licenses",
-    )[0]
-    return pd.Series(
-        license_df["License identifier (to use in repo card)"].values,
-        index=license_df.Fullname,
-    ).to_dict()
+        timeout=10,
+    ) as response:
+        tree = lxml.html.fromstring(response.read())
+
+    data: dict[str, str] = {}
+    # No position() filter on the rows: with thead/tbody markup the
+    # header row and the first data row both sit at position 1 of their
+    # parents, so position()>1 dropped the first license. The td filter
+    # below already excludes the th-only header row.
+    for row in tree.xpath("//table[1]//tr"):
+        cells = row.xpath("./td")
+        if len(cells) >= 2:  # noqa: PLR2004
+            fullname = cells[0].text_content().strip()
+            identifier = cells[1].text_content().strip()
+            if fullname:
+                data[fullname] = sys.intern(identifier)
+    _store_disk_cache(data)
+    return MappingProxyType(data)
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-import base64
 import logging
 import mimetypes
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, Any
 
 import markdown
 import streamlit as st
 from jinja2 import (
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     TemplateNotFound,
     select_autoescape,
@@ -30,11 +34,19 @@ from app.services.evaluations_extractor import (
     extract_evaluations_from_state,
 )
 
-if TYPE_CHECKING:
-    from collections.abc import Iterable
+try:
+    # pybase64 ships a SIMD-vectorized encoder; it is a drop-in
+    # replacement and matters for multi-MB figure uploads.
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
 try:
-    from weasyprint import CSS, HTML  # type: ignore[import-untyped]
+    from weasyprint import (  # type: ignore[import-untyped]
+        CSS,
+        HTML,
+        default_url_fetcher,
+    )
 
     _HAS_WEASYPRINT: bool = True
     _WEASYPRINT_ERR: Exception | None = None
@@ -67,21 +79,65 @@ _MARKDOWN_EXTENSIONS = [
     "sane_lists",
 ]
 
+# One converter instance per thread: markdown.markdown() would rebuild
+# the Markdown object and re-register every extension per call, but a
+# single shared instance is not thread-safe (convert() mutates parser
+# and extension state), and Streamlit sessions render concurrently.
+_MD_LOCAL = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """
+    Return this thread's reusable Markdown converter.
+
+    :return: The converter bound to the current thread.
+    :rtype: markdown.Markdown
+    """
+    md = getattr(_MD_LOCAL, "md", None)
+    if md is None:
+        md = markdown.Markdown(
+            extensions=_MARKDOWN_EXTENSIONS,
+            output_format="html",
+        )
+        _MD_LOCAL.md = md
+    return md
+
 _LOGGER = logging.getLogger(__name__)
 
+# Scheme used for figure URLs on the PDF path: the bytes are streamed
+# to WeasyPrint through _rt_url_fetcher instead of being inflated into
+# base64 data URIs inside the HTML payload.
+_PDF_URL_SCHEME = "rtmc://"
+
+# Set by save_model_card_pdf around its render so the upload normalizer
+# emits rtmc:// URLs; the HTML preview path keeps data URIs. A
+# ContextVar instead of a module global: Streamlit runs each session's
+# script in its own thread of one process, so a global flipped by one
+# session's PDF export would leak rtmc:// links into another session's
+# concurrent markdown render.
+_PDF_RENDER_MODE: ContextVar[bool] = ContextVar(
+    "_PDF_RENDER_MODE",
+    default=False,
+)
 
-def _safe_session_items() -> Iterable[tuple[str, Any]]:
+# Compiled once at import: both learning-architecture key spellings are
+# folded into a single pattern via an optional non-capturing prefix.
+_LA_RE = re.compile(
+    r"^(?:technical_specifications_)?learning_architecture_(\d+)_(.+)$",
+)
+
+
+def _safe_session_items() -> list[tuple[str, Any]]:
     """
-    Iterate over session_state items, only string keys.
+    Return session_state items with string keys as a materialized list.
 
-    :return: An iterable of (key, value) pairs.
-    :rtype: Iterable[tuple[str, Any]]
-    :yield: (key, value) pairs from session_state.
-    :rtype: Iterator[Iterable[tuple[str, Any]]]
+    Built on the fused single-pass scan so callers iterating more than
+    once do not re-walk the session state or re-run the key checks.
+
+    :return: A list of (key, value) pairs.
+    :rtype: list[tuple[str, Any]]
     """
-    for k, v in st.session_state.items():
-        if isinstance(k, str):
-            yield k, v
+    return list(_scan_session_once()["items"].items())
 
 
 def build_appendix_files_context() -> list[dict[str, Any]]:
@@ -101,7 +157,8 @@ def build_appendix_files_context() -> list[dict[str, Any]]:
             else None
         )
         mime = (norm or {}).get("type")
-        is_image = bool(mime and str(mime).lower().startswith("image/"))
+        # mimetypes returns lowercase types, so a slice compare suffices.
+        is_image = isinstance(mime, str) and mime[:6] == "image/"
         items.append(
             {
                 "label": (data.get("custom_label") or "").strip(),
@@ -136,13 +193,37 @@ def _format_date(
     """
     if not raw:
         return None
+    # Fast path for the default YYYYMMDD format: slicing the digits is
+    # far cheaper than strptime's format parsing.
+    if (
+        in_fmt == "%Y%m%d"
+        and out_fmt == "%Y/%m/%d"
+        and len(raw) == 8  # noqa: PLR2004
+        and raw.isdigit()
+        and "01" <= raw[4:6] <= "12"
+        and "01" <= raw[6:8] <= "31"
+    ):
+        return f"{raw[:4]}/{raw[4:6]}/{raw[6:8]}"
     try:
-        dt = datetime.strptime(raw, in_fmt).replace(tzinfo=UTC)
-        return dt.strftime(out_fmt)
+        # No tzinfo attach: the output format carries no timezone.
+        return datetime.strptime(raw, in_fmt).strftime(out_fmt)  # noqa: DTZ007
     except (ValueError, TypeError):
         return raw
 
 
+@lru_cache(maxsize=256)
+def _guess_mime(name: str) -> str | None:
+    """
+    Guess (and cache) the MIME type for a file name.
+
+    :param name: File name or path.
+    :type name: str
+    :return: The guessed MIME type, or None.
+    :rtype: str | None
+    """
+    return mimetypes.guess_type(name)[0]
+
+
 def _to_data_uri(mime: str | None, data: bytes) -> str | None:
     """
     Convert binary data to a data URI.
@@ -155,13 +236,48 @@ def _to_data_uri(mime: str | None, data: bytes) -> str | None:
     :rtype: str | None
     """
     try:
-        b64 = base64.b64encode(data).decode("ascii")
+        b64 = _b64.b64encode(data).decode("ascii")
     except (TypeError, UnicodeDecodeError):
         return None
     else:
         return f"data:{mime or 'application/octet-stream'};base64,{b64}"
 
 
+@lru_cache(maxsize=64)
+def _file_to_data_uri_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    fallback_mime: str | None,
+) -> str | None:
+    """
+    Read and encode a file, memoized on its identity and stat signature.
+
+    ``mtime_ns`` and ``size`` are part of the cache key so an re-uploaded
+    file with the same path is re-encoded.
+
+    :param path: Path to the local file.
+    :type path: str
+    :param mtime_ns: File modification time in nanoseconds.
+    :type mtime_ns: int
+    :param size: File size in bytes.
+    :type size: int
+    :param fallback_mime: Fallback MIME type if detection fails.
+    :type fallback_mime: str | None
+    :return: Data URI or None if file is not an image.
+    :rtype: str | None
+    """
+    try:
+        mime = _guess_mime(path) or fallback_mime
+        if not isinstance(mime, str) or mime[:6] != "image/":
+            return None
+        with open(path, "rb") as f:  # noqa: PTH123
+            data = f.read()
+        return _to_data_uri(mime, data)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
 def _file_to_data_uri(
     path: str,
     fallback_mime: str | None = None,
@@ -169,6 +285,9 @@ def _file_to_data_uri(
     """
     Open local file and return data URI if it's an image.
 
+    Repeated renders of the same unchanged file hit an in-process cache
+    instead of re-reading and re-encoding the bytes.
+
     :param path: Path to the local file.
     :type path: str
     :param fallback_mime: Fallback MIME type if detection fails,
@@ -178,15 +297,15 @@ def _file_to_data_uri(
     :rtype: str | None
     """
     try:
-        mime, _ = mimetypes.guess_type(path)
-        mime = mime or fallback_mime
-        if not mime or not mime.lower().startswith("image/"):
-            return None
-        with open(path, "rb") as f:  # noqa: PTH123
-            data = f.read()
-        return _to_data_uri(mime, data)
+        stat = os.stat(path)  # noqa: PTH116
     except (OSError, TypeError, ValueError):
         return None
+    return _file_to_data_uri_cached(
+        path,
+        stat.st_mtime_ns,
+        stat.st_size,
+        fallback_mime,
+    )
 
 
 def _normalize_upload_entry(
@@ -210,13 +329,26 @@ def _normalize_upload_entry(
     path = info.get("path")
     name = info.get("name") or (Path(path).name if path else None)
 
-    mime, _ = mimetypes.guess_type(name or "")
+    mime = _guess_mime(name or "")
 
-    url = (
-        _file_to_data_uri(path, fallback_mime=mime)
-        if path and Path(path).exists()
-        else None
-    )
+    # One stat covers both the existence check and the encoder cache
+    # key; a separate Path.exists() would just duplicate the syscall.
+    url: str | None = None
+    if path:
+        try:
+            stat = os.stat(path)  # noqa: PTH116
+        except (OSError, TypeError, ValueError):
+            stat = None
+        if stat is not None:
+            if _PDF_RENDER_MODE.get():
+                url = _PDF_URL_SCHEME + full_key
+            else:
+                url = _file_to_data_uri_cached(
+                    path,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    mime,
+                )
 
     return FileObj(name=name, type=mime, url=url)
 
@@ -227,11 +359,18 @@ def _normalize_file_from_key(
     """
     Normalize file object from session state.
 
+    Served from the primed ``normalized_uploads`` cache when available,
+    so a full render normalizes each upload exactly once.
+
     :param full_key: Full key of the uploaded file.
     :type full_key: str
     :return: Normalized file object or None if not found.
     :rtype: dict[str, str | None] | None
     """
+    cached = st.session_state.get("normalized_uploads", {}).get(full_key)
+    if cached is not None:
+        return cached
+
     uploads: dict[str, Any] = st.session_state.get("render_uploads", {})
     norm = _normalize_upload_entry(full_key, uploads)
     return (
@@ -245,43 +384,85 @@ def _normalize_file_from_key(
     )
 
 
-def _collect_hw_sw_from_state() -> dict[str, Any]:
+def _scan_session_once() -> dict[str, Any]:
     """
-    Collect hardware/software info from session_state.
+    Walk session_state once and pre-bucket everything the renderers need.
 
-    :return: Hardware/software info.
+    The context builders previously each re-scanned the full session
+    state; this fuses those passes into a single traversal.
+
+    :return: Buckets with the string-keyed item snapshot, hw/sw fields,
+        learning-architecture matches and modality entries.
     :rtype: dict[str, Any]
     """
+    items: dict[str, Any] = {}
     hw: dict[str, Any] = {}
-    for key, val in _safe_session_items():
+    la_matches: list[tuple[int, str, Any]] = []
+    modality_entries: list[dict[str, str]] = []
+
+    hw_cut = len(PREFIX_HW_SW)
+    for key, val in st.session_state.items():
+        if not isinstance(key, str):
+            continue
+        items[key] = val
         if key.startswith(PREFIX_HW_SW):
-            hw[key[len(PREFIX_HW_SW) :]] = val
-    return hw
+            hw[key[hw_cut:]] = val
+        m = _LA_RE.match(key)
+        if m:
+            la_matches.append((int(m.group(1)), m.group(2), val))
+        if isinstance(val, list):
+            if key.endswith("model_inputs"):
+                modality_entries.extend(
+                    {"modality": item, "source": "model_inputs"}
+                    for item in val
+                )
+            elif key.endswith("model_outputs"):
+                modality_entries.extend(
+                    {"modality": item, "source": "model_outputs"}
+                    for item in val
+                )
+
+    return {
+        "items": items,
+        "hw": hw,
+        "la_matches": la_matches,
+        "modalities": modality_entries,
+    }
+
+
+def _collect_hw_sw_from_state(
+    scan: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Collect hardware/software info from session_state.
+
+    :param scan: Pre-bucketed session scan, defaults to None
+    :type scan: dict[str, Any] | None, optional
+    :return: Hardware/software info.
+    :rtype: dict[str, Any]
+    """
+    if scan is None:
+        scan = _scan_session_once()
+    return dict(scan["hw"])
 
 
-def _collect_learning_architectures_from_state() -> list[dict[str, Any]]:
+def _collect_learning_architectures_from_state(
+    scan: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
     """
     Collect learning architectures from session_state.
 
+    :param scan: Pre-bucketed session scan, defaults to None
+    :type scan: dict[str, Any] | None, optional
     :return: List of learning architecture info.
     :rtype: list[dict[str, Any]]
     """
+    if scan is None:
+        scan = _scan_session_once()
+
     grouped: dict[int, dict[str, Any]] = {}
-    patterns = [
-        re.compile(r"^learning_architecture_(\d+)_(.+)$"),
-        re.compile(
-            r"^technical_specifications_learning_architecture_(\d+)_(.+)$",
-        ),
-    ]
-
-    for key, val in _safe_session_items():
-        for pat in patterns:
-            m = pat.match(key)
-            if m:
-                idx = int(m.group(1))
-                field = m.group(2)
-                grouped.setdefault(idx, {})[field] = val
-                break
+    for idx, field, val in scan["la_matches"]:
+        grouped.setdefault(idx, {})[field] = val
 
     forms = st.session_state.get("learning_architecture_forms") or {}
     for i in range(len(forms)):
@@ -304,28 +485,9 @@ def _collect_learning_architectures_from_state() -> list[dict[str, Any]]:
     return result
 
 
-def _normalize_render_key_to_fileobj(
-    full_key: str,
-) -> dict[str, str | None] | None:
-    """
-    Normalize render key to file object.
-
-    :param full_key: Full key of the uploaded file.
-    :type full_key: str
-    :return: Normalized file object or None if not found.
-    :rtype: dict[str, str | None] | None
-    """
-    uploads: dict[str, Any] = st.session_state.get("render_uploads", {})
-    norm = _normalize_upload_entry(full_key, uploads)
-    return (
-        None
-        if norm is None
-        else {
-            "name": norm.name,
-            "type": norm.type,
-            "url": norm.url,
-        }
-    )
+# The render-key spelling was a byte-identical copy of
+# _normalize_file_from_key; kept as an alias for importers.
+_normalize_render_key_to_fileobj = _normalize_file_from_key
 
 
 def _prime_normalized_uploads() -> None:
@@ -334,12 +496,18 @@ def _prime_normalized_uploads() -> None:
     norm: dict[str, dict[str, str | None]] = {}
     for key in list(uploads):
         try:
-            obj = _normalize_render_key_to_fileobj(key)
+            # Bypass the normalized_uploads cache: priming must rebuild
+            # every entry from the current uploads bucket.
+            obj = _normalize_upload_entry(key, uploads)
         except (OSError, FileNotFoundError, ValueError, TypeError):
             _LOGGER.exception("Failed to normalize upload %r", key)
             continue
         if obj:
-            norm[key] = obj
+            norm[key] = {
+                "name": obj.name,
+                "type": obj.type,
+                "url": obj.url,
+            }
     st.session_state["normalized_uploads"] = norm
 
 
@@ -354,11 +522,12 @@ def build_context_for_prefix(prefix: str) -> dict[str, Any]:  # noqa: C901, PLR0
     """
     ctx: dict[str, Any] = {}
     try:
+        scan = _scan_session_once()
         if isinstance(prefix, str):
             ctx.update(
                 {
                     k: v
-                    for k, v in _safe_session_items()
+                    for k, v in scan["items"].items()
                     if k.startswith(prefix)
                 },
             )
@@ -381,9 +550,9 @@ def build_context_for_prefix(prefix: str) -> dict[str, Any]:  # noqa: C901, PLR0
             )
         if prefix == PREFIX_TECH_SPEC:
             ctx["learning_architectures"] = (
-                _collect_learning_architectures_from_state()
+                _collect_learning_architectures_from_state(scan)
             )
-            hw = _collect_hw_sw_from_state()
+            hw = _collect_hw_sw_from_state(scan)
             if hw:
                 ctx["hw_and_sw"] = hw
             for k in ["technical_specifications_model_pipeline_figure"]:
@@ -403,19 +572,9 @@ def build_context_for_prefix(prefix: str) -> dict[str, Any]:  # noqa: C901, PLR0
                     la["architecture_figure"] = norm
         if prefix == PREFIX_TRAINING:
             ctx["DATA_INPUT_OUTPUT_TS"] = DATA_INPUT_OUTPUT_TS
-            modality_entries: list[dict[str, str]] = []
-            for key, value in _safe_session_items():
-                if key.endswith("model_inputs") and isinstance(value, list):
-                    modality_entries.extend(
-                        {"modality": item, "source": "model_inputs"}
-                        for item in value
-                    )
-                elif key.endswith("model_outputs") and isinstance(value, list):
-                    modality_entries.extend(
-                        {"modality": item, "source": "model_outputs"}
-                        for item in value
-                    )
+            modality_entries: list[dict[str, str]] = scan["modalities"]
             io_details: list[dict[str, Any]] = []
+            items = scan["items"]
             for entry in modality_entries:
                 clean = entry["modality"].strip().replace(" ", "_").lower()
                 source = entry["source"]
@@ -423,18 +582,17 @@ def build_context_for_prefix(prefix: str) -> dict[str, Any]:  # noqa: C901, PLR0
                     "entry": entry["modality"],
                     "source": source,
                 }
+                # The snapshot avoids the session-state proxy and the
+                # shared base avoids re-formatting the key per field.
+                base_mod = f"training_data_{clean}_{source}_"
                 for field_key in DATA_INPUT_OUTPUT_TS:
-                    per_mod_key = f"training_data_{clean}_{source}_{field_key}"
-                    val = (
-                        st.session_state.get(per_mod_key)
-                        or st.session_state.get(f"_{per_mod_key}")
-                        or st.session_state.get(f"__{per_mod_key}")
-                        or ""
+                    per_mod_key = base_mod + field_key
+                    detail[field_key] = (
+                        items.get(per_mod_key)
+                        or items.get("_" + per_mod_key)
+                        or items.get("__" + per_mod_key)
+                        or items.get("training_data_" + field_key, "")
                     )
-                    if not val:
-                        global_key = f"training_data_{field_key}"
-                        val = st.session_state.get(global_key, "")
-                    detail[field_key] = val
                 io_details.append(detail)
             ctx["training_data_inputs_outputs_technical_specifications"] = (
                 io_details
@@ -482,6 +640,19 @@ def _env() -> Environment:
     :return: Jinja2 environment instance.
     :rtype: Environment
     """
+    # Persist compiled template bytecode so later processes skip the
+    # Jinja compile; templates ship with the app, so no auto reload.
+    bytecode_cache = None
+    try:
+        cache_dir = TEMPLATES_DIR.parent / ".jinja_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(
+            directory=str(cache_dir),
+            pattern="__jinja2_%s.cache",
+        )
+    except OSError:
+        bytecode_cache = None
+
     env = Environment(
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
         autoescape=select_autoescape(
@@ -490,6 +661,8 @@ def _env() -> Environment:
         ),
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
     )
     env.globals["DATA_INPUT_OUTPUT_TS"] = DATA_INPUT_OUTPUT_TS
     env.globals["FIG_FIELD"] = {
@@ -503,6 +676,41 @@ def _env() -> Environment:
     return env
 
 
+@lru_cache(maxsize=None)
+def _get_template(name: str) -> Any:
+    """
+    Resolve (and cache) a compiled template by file name.
+
+    :param name: Template file name relative to the templates directory.
+    :type name: str
+    :return: The compiled Jinja2 template.
+    :rtype: Template
+    """
+    return _env().get_template(name)
+
+
+# Rendered markdown per (section_id, context fingerprint); sections
+# whose context slice is unchanged are returned without re-rendering.
+_SECTION_CACHE: dict[tuple[str, int], str] = {}
+_SECTION_CACHE_MAX = 64
+
+
+def _hashable(value: Any) -> Any:
+    """
+    Normalize a context value so it can participate in a hash key.
+
+    :param value: Context value, possibly a list or dict.
+    :type value: Any
+    :return: The value itself if hashable, otherwise its repr.
+    :rtype: Any
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
 def render_section_md(section_id: str) -> str:
     """
     Render a section of the model card markdown.
@@ -517,15 +725,69 @@ def render_section_md(section_id: str) -> str:
     ctx = build_context_for_prefix(cfg["prefix"])
     if not isinstance(ctx, dict):
         ctx = {}
+
+    cache_key = (
+        section_id,
+        hash(tuple(sorted((k, _hashable(v)) for k, v in ctx.items()))),
+    )
+    cached = _SECTION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        return _env().get_template(cfg["template"]).render(**ctx)
+        rendered = _get_template(cfg["template"]).render(ctx)
     except TemplateNotFound as exc:
         msg = f"Template not found: {cfg['template']}"
         raise FileNotFoundError(msg) from exc
 
+    if len(_SECTION_CACHE) >= _SECTION_CACHE_MAX:
+        _SECTION_CACHE.clear()
+    _SECTION_CACHE[cache_key] = rendered
+    return rendered
+
+
+def _render_sections_parallel() -> dict[str, str]:
+    """
+    Render all registered sections concurrently.
+
+    Section rendering is independent per section and spends much of its
+    time in figure I/O and encoding, so the renders are overlapped on a
+    small thread pool. Streamlit's script-run context is propagated to
+    the workers so session-state access keeps working.
+
+    :return: Mapping of section id to rendered markdown.
+    :rtype: dict[str, str]
+    """
+    try:
+        from streamlit.runtime.scriptrunner import (  # noqa: PLC0415
+            add_script_run_ctx,
+            get_script_run_ctx,
+        )
+
+        ctx = get_script_run_ctx()
+    except ImportError:
+        ctx = None
+
+    # Worker threads start from their own context, so the caller's PDF
+    # render mode is carried over explicitly alongside the script-run
+    # context.
+    pdf_mode = _PDF_RENDER_MODE.get()
+
+    def _render(section_id: str) -> str:
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        _PDF_RENDER_MODE.set(pdf_mode)
+        return render_section_md(section_id)
+
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(SECTION_REGISTRY)),
+    ) as pool:
+        return dict(zip(SECTION_REGISTRY, pool.map(_render, SECTION_REGISTRY)))
+
 
 def render_full_model_card_md(
     master_template: str = "model_card_master.md.j2",
+    stream: IO[str] | None = None,
 ) -> str:
     """
     Render the full model card markdown.
@@ -533,18 +795,28 @@ def render_full_model_card_md(
     :param master_template: Path to the master template file,
         defaults to "model_card_master.md.j2"
     :type master_template: str, optional
-    :return: Rendered markdown for the full model card.
+    :param stream: Optional text sink; when given, the master template is
+        streamed into it chunk by chunk instead of being joined into one
+        string, and an empty string is returned.
+    :type stream: IO[str] | None, optional
+    :return: Rendered markdown for the full model card, or "" when
+        streaming to `stream`.
     :rtype: str
     """
-    sections_md = {sid: render_section_md(sid) for sid in SECTION_REGISTRY}
+    # Prime once up front so every figure lookup below is a dict hit.
+    _prime_normalized_uploads()
+    sections_md = _render_sections_parallel()
     appendix_files = build_appendix_files_context()
-    return (
-        _env()
-        .get_template(master_template)
-        .render(
+    template = _get_template(master_template)
+    if stream is not None:
+        template.stream(
             sections=sections_md,
             appendix_files=appendix_files,
-        )
+        ).dump(stream)
+        return ""
+    return template.render(
+        sections=sections_md,
+        appendix_files=appendix_files,
     )
 
 
@@ -698,9 +970,50 @@ figcaption { font-size: 9pt; color: var(--muted); margin-top: 0.3em; }
 """  # noqa: RUF001
 
 
+def _minify_css(css: str) -> str:
+    """
+    Strip comments and collapse whitespace in a CSS string.
+
+    :param css: CSS text to minify.
+    :type css: str
+    :return: The minified CSS.
+    :rtype: str
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", css).strip()
+
+
+# Minified once at import: WeasyPrint and the HTML preview tokenize
+# every byte of the stylesheet, so comments and indentation are pure
+# parse overhead. DEFAULT_PDF_CSS stays readable for callers.
+_MIN_CSS = _minify_css(DEFAULT_PDF_CSS)
+
+# Static HTML fragments assembled once; render_markdown_to_html joins
+# them with the body instead of formatting one giant f-string per call.
+_HTML_PROLOGUE = (
+    "<!doctype html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+    "<title>Model Card</title>\n"
+)
+_HTML_DEFAULT_STYLE = "<style>" + _MIN_CSS + "</style>"
+_HTML_BODY_OPEN = "</head>\n<body>\n"
+_HTML_EPILOGUE = "\n</body>\n</html>"
+
+# Parsed once at import so each PDF export reuses the same stylesheet
+# object instead of re-running tinycss2 over the full default CSS.
+_DEFAULT_CSS_OBJ = None
+if _HAS_WEASYPRINT:
+    try:
+        _DEFAULT_CSS_OBJ = CSS(string=_MIN_CSS)
+    except Exception:  # noqa: BLE001
+        _DEFAULT_CSS_OBJ = None
+
+
 def render_markdown_to_html(
     md_text: str,
     extra_css: str | None = None,
+    *,
+    include_default_css: bool = True,
 ) -> str:
     """
     Render the given Markdown text to HTML.
@@ -709,28 +1022,50 @@ def render_markdown_to_html(
     :type md_text: str
     :param extra_css: Additional CSS styles to include, defaults to None
     :type extra_css: str | None, optional
+    :param include_default_css: Whether to inline DEFAULT_PDF_CSS into
+        the document head; the PDF path disables this and supplies the
+        stylesheet to WeasyPrint directly, defaults to True
+    :type include_default_css: bool, optional
     :return: The rendered HTML.
     :rtype: str
     """
-    html_body = markdown.markdown(
-        md_text,
-        extensions=_MARKDOWN_EXTENSIONS,
-        output_format="html",
-    )
-    css_block = f"<style>{DEFAULT_PDF_CSS}</style>"
+    html_body = _get_markdown().reset().convert(md_text)
+    parts = [_HTML_PROLOGUE]
+    if include_default_css:
+        parts.append(_HTML_DEFAULT_STYLE)
     if extra_css:
-        css_block += f"<style>{extra_css}</style>"
-    return f"""<!doctype html>
-<html>
-<head>
-<meta charset="utf-8">
-<title>Model Card</title>
-{css_block}
-</head>
-<body>
-{html_body}
-</body>
-</html>"""
+        parts.append(f"<style>{extra_css}</style>")
+    parts += (_HTML_BODY_OPEN, html_body, _HTML_EPILOGUE)
+    return "".join(parts)
+
+
+def _rt_url_fetcher(url: str, **kwargs: Any) -> dict[str, Any]:
+    """
+    Resolve rtmc:// figure URLs to raw file bytes for WeasyPrint.
+
+    :param url: URL requested by WeasyPrint.
+    :type url: str
+    :param kwargs: Extra fetcher options passed through to the default
+        fetcher for non-rtmc URLs.
+    :type kwargs: Any
+    :return: A WeasyPrint fetcher result dict.
+    :rtype: dict[str, Any]
+    """
+    if url.startswith(_PDF_URL_SCHEME):
+        full_key = url[len(_PDF_URL_SCHEME) :]
+        uploads: dict[str, Any] = st.session_state.get("render_uploads", {})
+        info = uploads.get(full_key) or {}
+        path = info.get("path")
+        if path and Path(path).exists():
+            name = info.get("name") or Path(path).name
+            mime, _ = mimetypes.guess_type(name)
+            return {
+                "file_obj": open(path, "rb"),  # noqa: PTH123, SIM115
+                "mime_type": mime or "application/octet-stream",
+            }
+        msg = f"Unknown upload key in {url!r}"
+        raise ValueError(msg)
+    return default_url_fetcher(url, **kwargs)
 
 
 def save_model_card_pdf(
@@ -766,16 +1101,35 @@ def save_model_card_pdf(
         )
         raise RuntimeError(msg)
 
-    md = render_full_model_card_md()
-    html = render_markdown_to_html(md, extra_css=css_text)
+    if st.session_state.pop("_rtmc_dirty", False):
+        _SECTION_CACHE.clear()
+
+    # Render with rtmc:// figure URLs so image bytes are streamed to
+    # WeasyPrint by _rt_url_fetcher instead of base64-inflating them
+    # into the HTML payload.
+    token = _PDF_RENDER_MODE.set(True)
+    try:
+        md = render_full_model_card_md()
+    finally:
+        _PDF_RENDER_MODE.reset(token)
+    # The stylesheets below are handed to WeasyPrint directly, so there
+    # is no need to also inline them into the HTML string.
+    html = render_markdown_to_html(md, include_default_css=False)
 
     css_list = []
     if css_file:
         css_list.append(CSS(filename=css_file))
     if css_text:
-        css_list.append(CSS(string=css_text))
-
-    HTML(string=html, base_url=base_url).write_pdf(path, stylesheets=css_list)
+        if css_text is DEFAULT_PDF_CSS and _DEFAULT_CSS_OBJ is not None:
+            css_list.append(_DEFAULT_CSS_OBJ)
+        else:
+            css_list.append(CSS(string=css_text))
+
+    HTML(
+        string=html,
+        base_url=base_url,
+        url_fetcher=_rt_url_fetcher,
+    ).write_pdf(path, stylesheets=css_list)
     return path
 
 
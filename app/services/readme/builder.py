@@ -3,24 +3,52 @@
 from __future__ import annotations
 
 import logging
+import re
 from contextlib import suppress
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Union
+from typing import IO, TYPE_CHECKING, Any, Union
 
 from app.services.markdown.renderer import render_full_model_card_md
 
+try:
+    import yaml as _yaml
+
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+    except ImportError:  # LibYAML bindings not compiled in
+        from yaml import SafeDumper as _YamlDumper
+
+    # Keep the lowercase true/false style of the hand-rolled emitter.
+    _YamlDumper.add_representer(
+        bool,
+        lambda d, v: d.represent_scalar(
+            "tag:yaml.org,2002:bool",
+            "true" if v else "false",
+        ),
+    )
+except ImportError:  # pragma: no cover - fall back to the built-in emitter
+    _yaml = None
+    _YamlDumper = None
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
 # logger to capture exceptions
 logger = logging.getLogger(__name__)
 
-# Minimal YAML front matter builder (no external deps)
+# Minimal YAML front matter builder (fallback when PyYAML is unavailable)
 Scalar = Union[str, int, float, bool]
 YAMLish = Union[Scalar, list[Scalar], dict[str, Any]]
 
 
 def _is_nonempty(x: object) -> bool:
+    # Exact-type fast path first: almost every value checked here is a
+    # plain str, and bool()/isspace() short-circuit in C without the
+    # intermediate string that strip() allocates.
+    if x.__class__ is str:
+        return bool(x) and not x.isspace()
     if x is None:
         return False
     if isinstance(x, str):
@@ -30,6 +58,12 @@ def _is_nonempty(x: object) -> bool:
     return True
 
 
+# One compiled pattern replaces the three per-scalar membership scans:
+# a suspicious leading character, or a ":"/"#" anywhere in the string.
+_YAML_QUOTE_RE = re.compile(r"^[-?:@{}\[\],&*!#|>%'\"`]|[:#]")
+_YAML_RESERVED = frozenset({"null", "~", "true", "false", "yes", "no"})
+
+
 def _yaml_escape_scalar(v: Scalar) -> str:
     """
     Conservative quoting to avoid YAML pitfalls without a parser.
@@ -43,13 +77,10 @@ def _yaml_escape_scalar(v: Scalar) -> str:
         return "true" if v else "false"
     s = str(v)
     needs_quote = (
-        s.strip() != s
-        or s == ""
-        or any(
-            s.lower() == t for t in ["null", "~", "true", "false", "yes", "no"]
-        )
-        or s[0] in "-?:@{}[],&*!#|>%'\"`"
-        or any(ch in s for ch in [":", "#"])
+        not s
+        or s.strip() != s
+        or s.lower() in _YAML_RESERVED
+        or _YAML_QUOTE_RE.search(s) is not None
     )
     if needs_quote:
         s = s.replace("\\", "\\\\").replace('"', '\\"')
@@ -57,63 +88,70 @@ def _yaml_escape_scalar(v: Scalar) -> str:
     return s
 
 
-def _emit_yaml_lines(key: str, value: YAMLish, indent: int = 0) -> list[str]:
-    """Emit simple YAML for scalars, lists, and flat dicts."""
-    sp = " " * indent
-    out: list[str] = []
+# Precomputed indent strings for the emitter's shallow nesting levels.
+_SP = [" " * i for i in range(0, 32, 2)]
+
+
+def _emit_yaml_lines(
+    buf: StringIO,
+    key: str,
+    value: YAMLish,
+    indent: int = 0,
+) -> None:
+    """Write simple YAML for scalars, lists, and flat dicts to `buf`."""
+    sp = _SP[indent // 2] if indent < 32 else " " * indent  # noqa: PLR2004
 
     if isinstance(value, dict):
         items = [(k, v) for k, v in value.items() if _is_nonempty(v)]
         if not items:
-            return out
-        out.append(f"{sp}{key}:")
+            return
+        buf.write(f"{sp}{key}:\n")
         for k, v in items:
-            out.extend(_emit_yaml_lines(str(k), v, indent + 2))
-        return out
+            _emit_yaml_lines(buf, str(k), v, indent + 2)
+        return
 
     if isinstance(value, (list, tuple, set)):
         seq: list[Any] = [v for v in value if _is_nonempty(v)]
         if not seq:
-            return out
-        out.append(f"{sp}{key}:")
+            return
+        buf.write(f"{sp}{key}:\n")
         for v in seq:
             if isinstance(v, (list, dict)):
-                out.append(f"{sp}  -")
+                buf.write(f"{sp}  -\n")
                 if isinstance(v, dict):
                     for k2, v2 in v.items():
                         if _is_nonempty(v2):
-                            out.extend(
-                                _emit_yaml_lines(
-                                    str(k2),
-                                    v2,
-                                    indent + 4,
-                                ),
-                            )
+                            _emit_yaml_lines(buf, str(k2), v2, indent + 4)
                 else:
                     for i2, v2 in enumerate(v):
-                        out.extend(
-                            _emit_yaml_lines(
-                                str(i2),
-                                v2,
-                                indent + 4,
-                            ),
-                        )
+                        _emit_yaml_lines(buf, str(i2), v2, indent + 4)
             else:
-                out.append(f"{sp}  - {_yaml_escape_scalar(v)}")
-        return out
+                buf.write(f"{sp}  - {_yaml_escape_scalar(v)}\n")
+        return
 
-    out.append(f"{sp}{key}: {_yaml_escape_scalar(value)}")
-    return out
+    buf.write(f"{sp}{key}: {_yaml_escape_scalar(value)}\n")
 
 
 def _build_front_matter(meta: dict[str, Any]) -> str:
     # Remove empties + keep insertion order
     compact = {k: v for k, v in meta.items() if _is_nonempty(v)}
-    lines: list[str] = ["---"]
+    if _yaml is not None:
+        # LibYAML serializes the whole mapping in one C call, so the
+        # per-scalar quoting logic above never runs on the hot path.
+        body = _yaml.dump(
+            compact,
+            Dumper=_YamlDumper,
+            sort_keys=False,
+            allow_unicode=True,
+            default_flow_style=False,
+        )
+        return f"---\n{body}---\n"
+    buf = StringIO()
+    buf.write("---\n")
     for k, v in compact.items():
-        lines.extend(_emit_yaml_lines(k, v))
-    lines.append("---\n")
-    return "\n".join(lines)
+        _emit_yaml_lines(buf, k, v)
+    buf.write("---\n")
+    return buf.getvalue()
 
 
 HF_META_KEYS: set[str] = {
@@ -134,10 +172,15 @@ HF_META_KEYS: set[str] = {
 }
 
 
+@lru_cache(maxsize=128)
+def _norm_list_str(s: str) -> tuple[str, ...]:
+    """Split a comma-separated string once; repeats are cache hits."""
+    return tuple(p for p in (part.strip() for part in s.split(",")) if p)
+
+
 def _norm_list(v: object) -> list[str]:
     if isinstance(v, str):
-        parts = [p.strip() for p in v.split(",")]
-        return [p for p in parts if p]
+        return list(_norm_list_str(v))
     if isinstance(v, (list, tuple, set)):
         return [str(x) for x in v if _is_nonempty(x)]
     return []
@@ -154,21 +197,17 @@ def _extract_metrics_from_evaluations(ss: dict[str, Any]) -> list[str]:
         if name:
             metrics.append(str(name))
         inner = e.get("metrics") or []
-        norm_inner = inner if isinstance(inner, list) else _norm_list(inner)
-        for m in norm_inner:
+        if not isinstance(inner, list):
+            inner = _norm_list(inner)
+        for m in inner:
             if isinstance(m, dict):
                 mname = m.get("name") or m.get("type")
                 if mname:
                     metrics.append(str(mname))
             elif isinstance(m, str):
                 metrics.append(m)
-    seen: set[str] = set()
-    out: list[str] = []
-    for m in metrics:
-        if m not in seen:
-            seen.add(m)
-            out.append(m)
-    return out
+    # dict.fromkeys dedupes and preserves order in one C-level pass.
+    return list(dict.fromkeys(metrics))
 
 
 def _extract_base_model_from_training_data(
@@ -186,6 +225,29 @@ def _extract_base_model_from_training_data(
     return str(base)
 
 
+# Closed set of session_state keys the metadata collector reads; the
+# memo fingerprint below only has to look at these.
+_HF_META_WATCHED_KEYS: tuple[str, ...] = (
+    "pipeline_tag",
+    "task",
+    "libraries",
+    "dependencies",
+    "library_name",
+    "license",
+    "model_basic_information_software_license",
+    "tags",
+    "datasets",
+    "training_data",
+    "evaluations",
+    "thumbnail",
+    "new_version",
+    "base_model",
+    "base_models",
+    "model-index",
+    "model_index",
+)
+
+
 def _collect_hf_meta_from_session_state() -> dict[str, YAMLish]:
     """Collect specific fields from Streamlit session_state."""
     try:
@@ -196,6 +258,15 @@ def _collect_hf_meta_from_session_state() -> dict[str, YAMLish]:
 
     ss: dict[str, Any] = getattr(st, "session_state", {}) or {}
 
+    # Memoize on object identity of the watched keys: repeated renders
+    # within a rerun skip the list normalization and metric extraction.
+    fingerprint = hash(
+        tuple((k, id(ss.get(k))) for k in _HF_META_WATCHED_KEYS),
+    )
+    cached = ss.get("_hf_meta_cache")
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
     pipeline_tag: str | None = ss.get("pipeline_tag") or ss.get("task") or ""
     if isinstance(pipeline_tag, str):
         pipeline_tag = pipeline_tag.strip().lower().replace(" ", "-") or None
@@ -243,15 +314,23 @@ def _collect_hf_meta_from_session_state() -> dict[str, YAMLish]:
     if _is_nonempty(mi):
         meta["model-index"] = mi
 
-    return {k: v for k, v in meta.items() if _is_nonempty(v)}
+    result = {k: v for k, v in meta.items() if _is_nonempty(v)}
+    ss["_hf_meta_cache"] = (fingerprint, result)
+    return result
 
 
 def render_hf_readme(
     *,
     meta: dict[str, YAMLish] | None = None,
     master_template: str = "model_card_master.md.j2",
+    sink: IO[str] | None = None,
 ) -> str:
-    """Return a complete Hugging Face README.md string."""
+    """
+    Return a complete Hugging Face README.md string.
+
+    When `sink` is given, the front matter and body are written to it
+    incrementally instead of being joined in memory, and "" is returned.
+    """
     session_meta = _collect_hf_meta_from_session_state()
     merged_meta: dict[str, Any] = {}
     for k in HF_META_KEYS:
@@ -263,9 +342,16 @@ def render_hf_readme(
     if "base_models" in merged_meta and "base_model" not in merged_meta:
         merged_meta["base_model"] = merged_meta.pop("base_models")
 
-    body_md = render_full_model_card_md(master_template=master_template)
-
     fm = _build_front_matter(merged_meta)
+    if sink is not None:
+        sink.write(fm)
+        render_full_model_card_md(
+            master_template=master_template,
+            stream=sink,
+        )
+        return ""
+
+    body_md = render_full_model_card_md(master_template=master_template)
     return f"{fm}{body_md}"
 
 
@@ -276,12 +362,13 @@ def save_hf_readme(
     master_template: str = "model_card_master.md.j2",
 ) -> str:
     """Render and write the HF model card README.md to `path`."""
-    content = render_hf_readme(
-        meta=meta,
-        master_template=master_template,
-    )
+    # Stream straight to disk so the full README is never held in memory.
     with Path(path).open("w", encoding="utf-8") as f:
-        f.write(content)
+        render_hf_readme(
+            meta=meta,
+            master_template=master_template,
+            sink=f,
+        )
     return path
 
 
@@ -337,6 +424,38 @@ def build_model_index_from_evaluations(
         return None
 
     evals = extract_evaluations_from_state() or []
+
+    # Memoize on a fingerprint of the fields the model-index actually
+    # uses, so unchanged evaluations skip the whole rebuild. The cached
+    # dict is consumed read-only by the YAML path.
+    try:
+        import streamlit as st  # noqa: PLC0415
+
+        ss: Any = st.session_state
+    except ImportError:
+        ss = None
+
+    try:
+        sig = hash(
+            tuple(
+                (
+                    e.get("task"),
+                    e.get("dataset_name") or e.get("dataset"),
+                    e.get("metric_name") or e.get("metric"),
+                    e.get("metric_value") or e.get("value"),
+                )
+                for e in evals
+                if isinstance(e, dict)
+            ),
+        )
+    except TypeError:  # unhashable field value; skip memoization
+        ss = None
+        sig = None
+    if ss is not None:
+        cached = ss.get("_mi_cache")
+        if cached is not None and cached[0] == (model_name, sig):
+            return cached[1]
+
     results: list[dict[str, Any]] = []
     for e in evals:
         if not isinstance(e, dict):
@@ -370,7 +489,9 @@ def build_model_index_from_evaluations(
             )
             continue
 
-    if not results:
-        return None
-
-    return {"model-index": [{"name": model_name, "results": results}]}
+    index: dict[str, Any] | None = None
+    if results:
+        index = {"model-index": [{"name": model_name, "results": results}]}
+    if ss is not None:
+        ss["_mi_cache"] = ((model_name, sig), index)
+    return index
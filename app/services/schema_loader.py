@@ -2,24 +2,39 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 import streamlit as st
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _loads = json.loads
+
 _SCHEMA_PATH: Path = Path(__file__).resolve().parent.parent / "core/schemas" / "model_card_schema.json"  # noqa: E501
 
 
-@st.cache_data  # This avoids reloading on every rerun
-def get_model_card_schema() -> dict[str, Any]:
+@lru_cache(maxsize=1)
+def _load_schema() -> dict[str, Any]:
     """
-    Load and return the model card schema.
+    Parse the schema file once per process.
 
     :return: The model card schema.
     :rtype: dict[str, Any]
     """
-    with _SCHEMA_PATH.open(encoding="utf-8") as f:
-        return cast("dict[str, Any]", json.load(f))
+    return cast("dict[str, Any]", _loads(_SCHEMA_PATH.read_bytes()))
 
 
+@st.cache_data  # This avoids reloading on every rerun
+def get_model_card_schema() -> dict[str, Any]:
+    """
+    Load and return the model card schema.
 
+    :return: The model card schema.
+    :rtype: dict[str, Any]
+    """
+    return _load_schema()
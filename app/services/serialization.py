@@ -4,12 +4,21 @@ from __future__ import annotations
 
 import json
 from collections import OrderedDict
-from copy import deepcopy
 from typing import Any, cast
 
 import streamlit as st
 
-from app.core.collections import insert_after
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
 from app.core.model_card.constants import (
     DATA_INPUT_OUTPUT_TS,
     EVALUATION_METRIC_FIELDS,
@@ -40,6 +49,40 @@ def _get_with_fallback(key: str) -> str:
     )
 
 
+def _modality_key_index() -> dict[str, list[str]]:
+    """
+    Return the session keys ending in model_inputs / model_outputs.
+
+    The index is cached in session_state and keyed on the key count, so
+    repeated serializations skip the whole-state key scan; adding or
+    removing a widget key invalidates it.
+
+    :return: Mapping of source suffix to the matching session keys.
+    :rtype: dict[str, list[str]]
+    """
+    ss = st.session_state
+    cached = ss.get("_modality_key_index")
+    if (
+        cached is not None
+        and cached[0] == len(ss)
+        and all(k in ss for keys in cached[1].values() for k in keys)
+    ):
+        return cast("dict[str, list[str]]", cached[1])
+
+    # Reserve the cache slot first so the stored key count matches the
+    # state the index was built from.
+    ss["_modality_key_index"] = None
+    index: dict[str, list[str]] = {"model_inputs": [], "model_outputs": []}
+    for k in ss:
+        if isinstance(k, str):
+            if k.endswith("model_inputs"):
+                index["model_inputs"].append(k)
+            elif k.endswith("model_outputs"):
+                index["model_outputs"].append(k)
+    ss["_modality_key_index"] = (len(ss), index)
+    return index
+
+
 def _iter_modalities() -> list[dict[str, str]]:
     """
     Collect modality entries from model_inputs / model_outputs lists.
@@ -48,19 +91,65 @@ def _iter_modalities() -> list[dict[str, str]]:
     :rtype: list[dict[str, str]]
     """
     out: list[dict[str, str]] = []
-    for k, v in st.session_state.items():
-        if isinstance(k, str) and isinstance(v, list):
-            if k.endswith("model_inputs"):
-                out.extend(
-                    {"modality": item, "source": "model_inputs"} for item in v
-                )
-            elif k.endswith("model_outputs"):
-                out.extend(
-                    {"modality": item, "source": "model_outputs"} for item in v
-                )
+    for source, keys in _modality_key_index().items():
+        for k in keys:
+            v = st.session_state.get(k)
+            if isinstance(v, list):
+                out.extend({"modality": item, "source": source} for item in v)
     return out
 
 
+# Precompiled field index per schema object. The schema is a module
+# constant, so the flat (section, sub, full_key, allowed) tuples are
+# built once; keeping a strong reference to the schema prevents id reuse.
+_SCHEMA_INDEX_CACHE: dict[
+    int,
+    tuple[
+        dict[str, Any],
+        list[tuple[str, str, str, frozenset[str] | None]],
+    ],
+] = {}
+
+
+def _schema_field_index(
+    schema: dict[str, Any],
+) -> list[tuple[str, str, str, frozenset[str] | None]]:
+    """
+    Flatten a schema into (section, sub, full_key, allowed) tuples.
+
+    :param schema: The schema to flatten.
+    :type schema: dict[str, Any]
+    :return: One tuple per field, with the full session key preformatted
+        and the allowed model types as a frozenset (None = all tasks).
+    :rtype: list[tuple[str, str, str, frozenset[str] | None]]
+    """
+    cached = _SCHEMA_INDEX_CACHE.get(id(schema))
+    if cached is not None:
+        return cached[1]
+
+    index: list[tuple[str, str, str, frozenset[str] | None]] = []
+    for section, fields in schema.items():
+        if isinstance(fields, list):
+            index.extend(
+                (section, full_key.removeprefix(section + "_"), full_key, None)
+                for full_key in fields
+            )
+        elif isinstance(fields, dict):
+            index.extend(
+                (
+                    section,
+                    key,
+                    f"{section}_{key}",
+                    None
+                    if props.get("model_types") is None
+                    else frozenset(props["model_types"]),
+                )
+                for key, props in fields.items()
+            )
+    _SCHEMA_INDEX_CACHE[id(schema)] = (schema, index)
+    return index
+
+
 def _collect_raw_sections(
     schema: dict[str, Any],
     current_task: str | None,
@@ -75,19 +164,11 @@ def _collect_raw_sections(
     :return: A dictionary containing the raw section data.
     :rtype: dict[str, dict[str, Any]]
     """
-    raw: dict[str, dict[str, Any]] = {}
-    for section, fields in schema.items():
-        sect: dict[str, Any] = {}
-        if isinstance(fields, list):
-            for full_key in fields:
-                sub = full_key.removeprefix(section + "_")
-                sect[sub] = st.session_state.get(full_key, "")
-        elif isinstance(fields, dict):
-            for key, props in fields.items():
-                allowed = props.get("model_types")
-                if allowed is None or current_task in allowed:
-                    sect[key] = st.session_state.get(f"{section}_{key}", "")
-        raw[section] = sect
+    raw: dict[str, dict[str, Any]] = {section: {} for section in schema}
+    ss_get = st.session_state.get
+    for section, sub, full_key, allowed in _schema_field_index(schema):
+        if allowed is None or current_task in allowed:
+            raw[section][sub] = ss_get(full_key, "")
     return raw
 
 
@@ -102,18 +183,45 @@ def _build_learning_architectures() -> list[dict[str, Any]]:
     out: list[dict[str, Any]] = []
     for i in range(len(la_forms)):
         prefix = f"learning_architecture_{i}_"
-        arch = deepcopy(LEARNING_ARCHITECTURE)
-        for field in arch:
-            arch[field] = st.session_state.get(f"{prefix}{field}", arch[field])
+        # A shallow copy is enough here: the template holds scalars plus
+        # two list defaults, and each list is re-copied below so forms
+        # never share a mutable default.
+        arch = LEARNING_ARCHITECTURE.copy()
+        for field, default in arch.items():
+            arch[field] = st.session_state.get(
+                f"{prefix}{field}",
+                list(default) if isinstance(default, list) else default,
+            )
         arch["id"] = cast("Any", i)
         out.append(arch)
     return out
 
 
+def _collect_training_io() -> list[dict[str, Any]]:
+    """
+    Collect training inputs/outputs technical specifications.
+
+    :return: One detail dict per modality entry.
+    :rtype: list[dict[str, Any]]
+    """
+    io_details: list[dict[str, Any]] = []
+    for entry in _iter_modalities():
+        clean = entry["modality"].strip().replace(" ", "_").lower()
+        src = entry["source"]
+        detail = {"entry": entry["modality"], "source": src}
+        for field in DATA_INPUT_OUTPUT_TS:
+            detail[field] = _get_with_fallback(
+                f"training_data_{clean}_{src}_{field}",
+            )
+        io_details.append(detail)
+    return io_details
+
+
 def _base_structured(
     raw: dict[str, dict[str, Any]],
     current_task: str | None,
     learning_architectures: list[dict[str, Any]],
+    training_io: list[dict[str, Any]],
 ) -> OrderedDict[str, Any]:
     """
     Create the base ordered output with top-level sections.
@@ -124,6 +232,8 @@ def _base_structured(
     :type current_task: str | None
     :param learning_architectures: The list of learning architectures.
     :type learning_architectures: list[dict[str, Any]]
+    :param training_io: Training inputs/outputs technical specifications.
+    :type training_io: list[dict[str, Any]]
     :return: The base structured output.
     :rtype: OrderedDict[str, Any]
     """
@@ -146,48 +256,23 @@ def _base_structured(
     if "hw_and_sw" in raw:
         structured["technical_specifications"]["hw_and_sw"] = raw["hw_and_sw"]
 
-    if "training_data" in raw:
-        structured["training_data"] = raw["training_data"]
-
-    return structured
-
-
-def _inject_training_iots(
-    raw: dict[str, dict[str, Any]],
-    structured: OrderedDict[str, Any],
-) -> None:
-    """
-    Inject training inputs/outputs technical specifications
-    into the structured output.
-
-    :param raw: The raw section data.
-    :type raw: dict[str, dict[str, Any]]
-    :param structured: The structured output.
-    :type structured: OrderedDict[str, Any]
-    """  # noqa: D205
-    io_details: list[dict[str, Any]] = []
-    for entry in _iter_modalities():
-        clean = entry["modality"].strip().replace(" ", "_").lower()
-        src = entry["source"]
-        detail = {"entry": entry["modality"], "source": src}
-        for field in DATA_INPUT_OUTPUT_TS:
-            detail[field] = _get_with_fallback(
-                f"training_data_{clean}_{src}_{field}",
+    # Build training_data directly in its final key order: the IO specs
+    # slot in right after url_info (or at the end when it is absent), so
+    # no insert_after splice pass is needed afterwards.
+    training_data: dict[str, Any] = {}
+    for key, value in raw.get("training_data", {}).items():
+        training_data[key] = value
+        if key == "url_info":
+            training_data["inputs_outputs_technical_specifications"] = (
+                training_io
             )
-        io_details.append(detail)
-
-    raw.setdefault("training_data", {})
-    raw["training_data"]["inputs_outputs_technical_specifications"] = (
-        io_details
-    )
-
-    structured.setdefault("training_data", {})
-    structured["training_data"] = insert_after(
-        structured["training_data"],
+    training_data.setdefault(
         "inputs_outputs_technical_specifications",
-        io_details,
-        "url_info",
+        training_io,
     )
+    structured["training_data"] = training_data
+
+    return structured
 
 
 def _attach_metrics(
@@ -205,17 +290,26 @@ def _attach_metrics(
     structured["evaluations"] = extract_evaluations_from_state()
     task_norm = (current_task or "").strip().lower()
 
+    # Hoist the per-task invariants out of the loops: the metric types
+    # and their field tuples do not change per evaluation form.
+    metric_types = TASK_METRIC_MAP.get(task_norm, [])
+    if not metric_types:
+        return
+    fields_by_type = {
+        mt: EVALUATION_METRIC_FIELDS[mt] for mt in metric_types
+    }
+    ss_get = st.session_state.get
+
     for eval_form in structured.get("evaluations", []):
         name = eval_form.get("name", "")
-        for metric_type in TASK_METRIC_MAP.get(task_norm, []):
+        prefix = f"evaluation_{name}_"
+        for metric_type in metric_types:
             metrics: list[dict[str, Any]] = []
-            list_key = f"evaluation_{name}_{metric_type}_list"
-            for metric_name in st.session_state.get(list_key, []):
+            for metric_name in ss_get(f"{prefix}{metric_type}_list", []):
                 m = {"name": metric_name}
-                for field in EVALUATION_METRIC_FIELDS[metric_type]:
-                    m[field] = _get_with_fallback(
-                        f"evaluation_{name}_{metric_name}_{field}",
-                    )
+                base = f"{prefix}{metric_name}_"
+                for field in fields_by_type[metric_type]:
+                    m[field] = _get_with_fallback(base + field)
                 metrics.append(m)
             if metrics:
                 eval_form[metric_type] = metrics
@@ -234,12 +328,16 @@ def parse_into_json(schema: dict[str, Any]) -> str:
 
     raw = _collect_raw_sections(schema, current_task)
     learning_architectures = _build_learning_architectures()
-    structured = _base_structured(raw, current_task, learning_architectures)
+    structured = _base_structured(
+        raw,
+        current_task,
+        learning_architectures,
+        _collect_training_io(),
+    )
 
-    _inject_training_iots(raw, structured)
     _attach_metrics(structured, current_task)
 
     if "other_considerations" in raw:
         structured["other_considerations"] = raw["other_considerations"]
 
-    return json.dumps(structured, indent=2)
+    return _dumps(structured)
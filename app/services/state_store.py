@@ -7,6 +7,34 @@ from typing import Any
 import streamlit as st
 
 from app.core.date_utils import is_yyyymmdd, set_safe_date_field, to_date
+from app.core.model_card.constants import EVALUATION_METRIC_FIELDS, SCHEMA
+
+# One-pass slugification table: spaces to underscores and ASCII
+# uppercase to lowercase, replacing the .replace(" ", "_").lower()
+# chain and its intermediate string allocations. Modality entries are
+# ASCII labels, so the ASCII-only lowercasing is equivalent.
+_SLUG_TABLE = str.maketrans(
+    {" ": "_", **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}},
+)
+
+# Deletes the accepted date separators in one pass.
+_DATE_DELETE = str.maketrans("", "", "-/")
+
+_DATE_FMT = "%Y%m%d"
+
+# Sentinel for single-lookup membership tests on the session-state proxy.
+_MISSING = object()
+
+# Known key sets derived from the schema constants, so the per-field
+# dispatch below does hash lookups instead of prefix/suffix scans.
+_METRIC_GROUP_KEYS = frozenset(EVALUATION_METRIC_FIELDS)
+_CREATION_DATE_KEYS = frozenset(
+    key
+    for fields in SCHEMA.values()
+    if isinstance(fields, dict)
+    for key in fields
+    if key.endswith("creation_date")
+)
 
 
 def store_value(key: str) -> None:
@@ -28,9 +56,8 @@ def load_value(key: str, default: object | None = None) -> None:
         to None
     :type default: Optional[object], optional
     """
-    if key not in st.session_state:
-        st.session_state[key] = default
-    st.session_state["_" + key] = st.session_state[key]
+    ss = st.session_state
+    ss["_" + key] = ss.setdefault(key, default)
 
 def _normalize_to_yyyymmdd(value: object) -> str | None:
     """
@@ -43,12 +70,19 @@ def _normalize_to_yyyymmdd(value: object) -> str | None:
     :rtype: str | None
     """  # noqa: D205
     if isinstance(value, str):
-        s = value.strip().replace("-", "").replace("/", "")
+        s = value.strip()
+        # Common case: already bare YYYYMMDD, no separator scan needed.
+        if is_yyyymmdd(s):
+            return s
+        s = s.translate(_DATE_DELETE)
         return s if is_yyyymmdd(s) else None
-    if isinstance(value, datetime):
-        return value.strftime("%Y%m%d")
+    # Exact-type check covers the common cases with a single comparison;
+    # date/datetime subclasses fall through to the isinstance check.
+    t = type(value)
+    if t is date or t is datetime:
+        return value.strftime(_DATE_FMT)
     if isinstance(value, date):
-        return value.strftime("%Y%m%d")
+        return value.strftime(_DATE_FMT)
     return None
 
 
@@ -61,10 +95,17 @@ def populate_session_state_from_json(  # noqa: C901, PLR0912, PLR0915
     :param data: The data to populate the session state with.
     :type data: dict[str, Any]
     """
+    # Bind the proxy once: every write below is a local lookup instead
+    # of a module attribute walk, and per-section writes are collected
+    # into a plain dict flushed with one update() call on the proxy.
+    ss = st.session_state
+
     if "task" in data:
-        st.session_state["task"] = data["task"]
+        ss["task"] = data["task"]
 
     for section, content in data.items():
+        pending: dict[str, Any] = {}
+
         # ---------------------------
         # TRAINING DATA
         # ---------------------------
@@ -72,35 +113,32 @@ def populate_session_state_from_json(  # noqa: C901, PLR0912, PLR0915
             for k, v in content.items():
                 full_key = f"{section}_{k}"
                 if not isinstance(v, list):
-                    st.session_state[full_key] = v
+                    pending[full_key] = v
                 else:
-                    st.session_state[full_key] = v
-                    st.session_state[full_key + "_list"] = v
+                    pending[full_key] = v
+                    pending[full_key + "_list"] = v
 
             ios: list[dict[str, Any]] = content.get(
                 "inputs_outputs_technical_specifications", [],
             )
             for io in ios:
-                clean: str = (
-                    io["entry"]
-                    .strip()
-                    .replace(" ", "_")
-                    .lower()
-                )
+                clean: str = io["entry"].strip().translate(_SLUG_TABLE)
                 src: str = io["source"]
+                # The prefix is invariant per io dict; plain concatenation
+                # inside the loop avoids re-formatting it per field.
+                io_prefix = f"training_data_{clean}_{src}_"
                 for io_key, io_val in io.items():
                     if io_key not in ["entry", "source"]:
-                        io_full_key = f"training_data_{clean}_{src}_{io_key}"
-                        st.session_state[io_full_key] = io_val
-                        raw_key = f"_{io_full_key}"
-                        st.session_state[raw_key] = io_val
+                        io_full_key = io_prefix + io_key
+                        pending[io_full_key] = io_val
+                        pending["_" + io_full_key] = io_val
 
         # ---------------------------
         # EVALUATIONS
         # ---------------------------
         elif section == "evaluations":
             eval_names: list[str] = [entry["name"] for entry in content]
-            st.session_state["evaluation_forms"] = eval_names
+            pending["evaluation_forms"] = eval_names
 
             for entry in content:
                 name: str = entry["name"].replace(" ", "_")
@@ -111,41 +149,30 @@ def populate_session_state_from_json(  # noqa: C901, PLR0912, PLR0915
                     if key == "inputs_outputs_technical_specifications":
                         for io in value:
                             clean2: str = (
-                                io["entry"]
-                                .strip()
-                                .replace(" ", "_")
-                                .lower()
+                                io["entry"].strip().translate(_SLUG_TABLE)
                             )
                             src2: str = io["source"]
+                            io_prefix2 = prefix + clean2 + "_" + src2 + "_"
                             for io_key, io_val in io.items():
                                 if io_key not in ["entry", "source"]:
-                                    io_full_key = (
-                                        prefix
-                                        + clean2
-                                        + "_"
-                                        + src2
-                                        + "_"
-                                        + io_key
-                                    )
-                                    st.session_state[io_full_key] = io_val
-                                    st.session_state["_" + io_full_key] = io_val
+                                    io_full_key = io_prefix2 + io_key
+                                    pending[io_full_key] = io_val
+                                    pending["_" + io_full_key] = io_val
 
                     # Metric group list(s)
-                    elif isinstance(value, list) and key.startswith("type_"):
+                    elif key in _METRIC_GROUP_KEYS and isinstance(value, list):
                         metric_names: list[str] = [m["name"] for m in value]
-                        st.session_state[f"{prefix}{key}_list"] = metric_names
-                        st.session_state[f"{prefix}{key}"] = metric_names
+                        pending[f"{prefix}{key}_list"] = metric_names
+                        pending[f"{prefix}{key}"] = metric_names
 
                         for metric in value:
                             metric_prefix = (
                                 f"evaluation_{name}."
-                                f"{metric['name']}"
+                                f"{metric['name']}_"
                             )
                             for m_field, m_val in metric.items():
                                 if m_field != "name":
-                                    st.session_state[
-                                        f"{metric_prefix}_{m_field}"
-                                    ] = m_val
+                                    pending[metric_prefix + m_field] = m_val
 
                     elif "date" in key.lower():
                         base_key = f"{prefix}{key}"          # stores YYYYMMDD
@@ -155,36 +182,21 @@ def populate_session_state_from_json(  # noqa: C901, PLR0912, PLR0915
                         # Normalize incoming value and construct date object
                         # Seed ONCE so user edits persist across reruns
                         if (
-                            base_key not in st.session_state
-                            and widget_key not in st.session_state
+                            ss.get(base_key, _MISSING) is _MISSING
+                            and ss.get(widget_key, _MISSING) is _MISSING
                         ):
+                            # _normalize_to_yyyymmdd only returns valid
+                            # YYYYMMDD strings, so no re-validation here.
                             norm = _normalize_to_yyyymmdd(value)
-                            if norm and is_yyyymmdd(norm):
-                                d = to_date(norm)
-                            else:
-                                d = None
-                                norm = None
-                            st.session_state[base_key] = norm
+                            d = to_date(norm) if norm else None
+                            pending[base_key] = norm
                             # widget state (date or None)
-                            st.session_state[widget_key] = d
-                            st.session_state[raw_key] = d
-
-                    elif isinstance(value, str) and is_yyyymmdd(value):
-                        base_key = f"{prefix}{key}"
-                        widget_key = f"{base_key}_widget"
-                        raw_key = f"_{widget_key}"
-                        if (
-                            base_key not in st.session_state
-                            and widget_key not in st.session_state
-                        ):
-                            d = to_date(value)
-                            st.session_state[base_key] = value if d else None
-                            st.session_state[widget_key] = d
-                            st.session_state[raw_key] = d
+                            pending[widget_key] = d
+                            pending[raw_key] = d
 
                     # Any other simple field
                     else:
-                        st.session_state[f"{prefix}{key}"] = value
+                        pending[f"{prefix}{key}"] = value
 
         # ---------------------------
         # TECHNICAL SPECIFICATIONS
@@ -192,28 +204,27 @@ def populate_session_state_from_json(  # noqa: C901, PLR0912, PLR0915
         elif section == "technical_specifications":
             for k, v in content.items():
                 if k == "learning_architectures" and isinstance(v, list):
-                    st.session_state["learning_architecture_forms"] = {
+                    pending["learning_architecture_forms"] = {
                         f"Learning Architecture {i + 1}": {}
                         for i in range(len(v))
                     }
                     for i, arch in enumerate(v):
                         prefix = f"learning_architecture_{i}_"
                         for key, value in arch.items():
-                            full_key = f"{prefix}{key}"
-                            st.session_state[full_key] = value
+                            pending[prefix + key] = value
                     continue
 
                 if k == "hw_and_sw" and isinstance(v, dict):
                     for hw_sw_key, hw_sw_val in v.items():
                         full_key = f"{k}_{hw_sw_key}"
-                        st.session_state[full_key] = hw_sw_val
+                        pending[full_key] = hw_sw_val
                     continue
 
                 full_key = f"{section}_{k}"
-                st.session_state[full_key] = v
+                pending[full_key] = v
 
                 if isinstance(v, list):
-                    st.session_state[full_key + "_list"] = v
+                    pending[full_key + "_list"] = v
 
         # ---------------------------
         # GENERIC DICTIONARY SECTIONS
@@ -223,20 +234,22 @@ def populate_session_state_from_json(  # noqa: C901, PLR0912, PLR0915
                 full_key = f"{section}_{k}"
 
                 # Handle creation_date via helper (and seed once)
-                if k.endswith("creation_date"):
+                if k in _CREATION_DATE_KEYS:
                     widget_key = f"{full_key}_widget"
-                    raw_key = f"_{widget_key}"
                     if (
-                        full_key not in st.session_state
-                        and widget_key not in st.session_state
+                        ss.get(full_key, _MISSING) is _MISSING
+                        and ss.get(widget_key, _MISSING) is _MISSING
                     ):
                         norm = _normalize_to_yyyymmdd(v)
                         set_safe_date_field(full_key, norm)
                     if isinstance(v, list):
-                        st.session_state[full_key + "_list"] = v
+                        pending[full_key + "_list"] = v
                     continue
 
                 # Generic assignment for non-date fields
-                st.session_state[full_key] = v
+                pending[full_key] = v
                 if isinstance(v, list):
-                    st.session_state[full_key + "_list"] = v
+                    pending[full_key + "_list"] = v
+
+        if pending:
+            ss.update(pending)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict, cast
+from typing import TYPE_CHECKING, NotRequired, TypedDict, cast
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -59,6 +59,9 @@ class UploadMeta(TypedDict):
 
     path: str
     name: str
+    # Set when the file is written so validation can check presence
+    # without a filesystem stat.
+    exists: NotRequired[bool]
 
 
 class AppendixMeta(TypedDict, total=False):
@@ -219,6 +222,7 @@ def save_appendix_files(
         st.session_state[REG_RENDER_UPLOADS][stored_name] = UploadMeta(
             path=str(save_path),
             name=original_name,
+            exists=True,
         )
         register_path(str(save_path))
         saved_any = True
@@ -321,7 +325,11 @@ def field_overwrite(
         f.write(uploaded_file.getbuffer())
 
     register_path(str(save_path))
-    meta: UploadMeta = {"path": str(save_path), "name": safe_name}
+    meta: UploadMeta = {
+        "path": str(save_path),
+        "name": safe_name,
+        "exists": True,
+    }
     st.session_state[REG_RENDER_UPLOADS][full_key] = meta
     return meta
 
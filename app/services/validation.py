@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -20,6 +21,130 @@ if TYPE_CHECKING:
 MissingItem = tuple[str, str]  # (section, human_readable_label)
 _EMPTY_SENTINELS: tuple[Any, ...] = ("", None, [], {})
 
+# Shared skip/filter sets, hoisted so the validators do O(1) frozenset
+# membership tests instead of rebuilding locals per call.
+_SKIP_FIELDS = frozenset(DATA_INPUT_OUTPUT_TS)
+_SKIP_KEYS = frozenset({
+    "input_content_rtstruct_subtype",
+    "output_content_rtstruct_subtype",
+})
+_SKIP_SECTIONS = frozenset({
+    "evaluation_data_methodology_results_commisioning",
+    "learning_architecture",
+    "qualitative_evaluation",
+})
+_SKIP_SECTIONS_FOR_DATA_IO = frozenset({
+    "training_data",
+    "evaluation_data_methodology_results_commisioning",
+})
+_APPROVED_SAME_KEYS = frozenset({
+    "evaluated_by_name",
+    "evaluated_by_institution",
+    "evaluated_by_contact_email",
+})
+_MODALITY_SUFFIXES = ("model_inputs", "model_outputs")
+
+
+@dataclass(frozen=True)
+class _ValidationPlan:
+    """Precomputed per-(schema, task) view of the required fields."""
+
+    # ((section, label), full_key), split by field type so the per-rerun
+    # loops run straight through without re-dispatching on the type. The
+    # missing-item tuple is prebuilt here, so a miss appends a stored
+    # constant instead of allocating a fresh 2-tuple.
+    plain_fields: tuple[tuple[MissingItem, str], ...]
+    image_fields: tuple[tuple[MissingItem, str], ...]
+    # (key, label) for the evaluation section, already filtered
+    eval_required: tuple[tuple[str, str], ...]
+    metric_types: tuple[str, ...]
+    # metric type -> ((field key, label), ...) for its required fields
+    metric_required: dict[str, tuple[tuple[str, str], ...]]
+
+
+# Keyed on (schema identity, task); the schema reference in the value
+# keeps the id stable for the lifetime of the cache entry.
+_PLAN_CACHE: dict[
+    tuple[int, str | None],
+    tuple[dict[str, Any], _ValidationPlan],
+] = {}
+
+
+def _validation_plan(
+    schema: dict[str, dict[str, dict[str, Any]]],
+    current_task: str | None,
+) -> _ValidationPlan:
+    """
+    Build (or fetch) the validation plan for a schema and task.
+
+    The set of required fields is fixed for a given task, so the skip
+    and required checks run once here instead of per field per rerun.
+
+    :param schema: The model card schema.
+    :type schema: dict[str, dict[str, dict[str, Any]]]
+    :param current_task: The current task identifier.
+    :type current_task: str | None
+    :return: The precomputed plan.
+    :rtype: _ValidationPlan
+    """
+    cached = _PLAN_CACHE.get((id(schema), current_task))
+    if cached is not None:
+        return cached[1]
+
+    plain_fields: list[tuple[MissingItem, str]] = []
+    image_fields: list[tuple[MissingItem, str]] = []
+    for section, fields in schema.items():
+        if section in _SKIP_SECTIONS or not isinstance(fields, dict):
+            continue
+        for key, props in fields.items():
+            if key in _SKIP_KEYS or (
+                key in _SKIP_FIELDS
+                and section in _SKIP_SECTIONS_FOR_DATA_IO
+            ):
+                continue
+            if not _field_required_for_task(props, current_task):
+                continue
+            entry = ((section, _label_for(props, key)), f"{section}_{key}")
+            if (props.get("type") or "").lower() == "image":
+                image_fields.append(entry)
+            else:
+                plain_fields.append(entry)
+
+    eval_section = schema.get(
+        "evaluation_data_methodology_results_commisioning",
+        {},
+    )
+    metric_types = tuple(TASK_METRIC_MAP.get(current_task or "", []))
+    metric_keys = {
+        f for mt in metric_types for f in EVALUATION_METRIC_FIELDS.get(mt, [])
+    }
+    eval_required = tuple(
+        (key, _label_for(props, key))
+        for key, props in eval_section.items()
+        if key not in metric_keys
+        and key not in _SKIP_FIELDS
+        and _field_required_for_task(props, current_task)
+    )
+    metric_required = {
+        mt: tuple(
+            (field_key, _label_for(props, field_key))
+            for field_key in EVALUATION_METRIC_FIELDS.get(mt, [])
+            if (props := eval_section.get(field_key))
+            and props.get("required", False)
+        )
+        for mt in metric_types
+    }
+
+    plan = _ValidationPlan(
+        plain_fields=tuple(plain_fields),
+        image_fields=tuple(image_fields),
+        eval_required=eval_required,
+        metric_types=metric_types,
+        metric_required=metric_required,
+    )
+    _PLAN_CACHE[(id(schema), current_task)] = (schema, plan)
+    return plan
+
 
 def is_empty(value: object) -> bool:
     """
@@ -30,6 +155,14 @@ def is_empty(value: object) -> bool:
     :return: True if the value is empty, otherwise False.
     :rtype: bool
     """
+    # Dispatch on exact type for the values session_state actually
+    # holds; the sentinel scan only runs for exotic types, keeping the
+    # old equality semantics (an empty tuple or set is not "empty").
+    if value is None:
+        return True
+    cls = value.__class__
+    if cls is str or cls is list or cls is dict:
+        return not value
     return value in _EMPTY_SENTINELS
 
 
@@ -45,10 +178,16 @@ def _has_required_image(full_key: str) -> bool:
     rec = st.session_state.get("render_uploads", {}).get(full_key)
     if not rec:
         return False
-    try:
-        return Path(rec.get("path", "")).exists()
-    except (TypeError, OSError):
-        return False
+    exists = rec.get("exists")
+    if exists is None:
+        # Records written before the flag existed (or restored from a
+        # saved card) fall back to one stat, cached on the record.
+        try:
+            exists = Path(rec.get("path", "")).exists()
+        except (TypeError, OSError):
+            exists = False
+        rec["exists"] = exists
+    return bool(exists)
 
 
 def _label_for(props: dict[str, Any], key: str) -> str:
@@ -97,12 +236,19 @@ def _modalities_from_state() -> list[tuple[str, str]]:
     """
     modalities: list[tuple[str, str]] = []
     for key, value in st.session_state.items():
-        if not isinstance(key, str) or not isinstance(value, list):
-            continue
-        if key.endswith("model_inputs"):
-            modalities.extend((item, "model_inputs") for item in value)
-        elif key.endswith("model_outputs"):
-            modalities.extend((item, "model_outputs") for item in value)
+        # One endswith call with a tuple argument rejects the vast
+        # majority of keys before any value/type inspection.
+        if (
+            isinstance(key, str)
+            and key.endswith(_MODALITY_SUFFIXES)
+            and isinstance(value, list)
+        ):
+            source = (
+                "model_inputs"
+                if key.endswith("model_inputs")
+                else "model_outputs"
+            )
+            modalities.extend((item, source) for item in value)
     return modalities
 
 
@@ -121,43 +267,15 @@ def validate_static_fields(
     :rtype: list[MissingItem]
     """
     missing: list[MissingItem] = []
-
-    skip_fields = set(DATA_INPUT_OUTPUT_TS.keys())
-    skip_keys = {
-        "input_content_rtstruct_subtype",
-        "output_content_rtstruct_subtype",
-    }
-    skip_sections = {
-        "evaluation_data_methodology_results_commisioning",
-        "learning_architecture",
-        "qualitative_evaluation",
-    }
-
-    for section, fields in schema.items():
-        if section in skip_sections or not isinstance(fields, dict):
-            continue
-        for key, props in fields.items():
-            if key in skip_keys or (
-                key in skip_fields
-                and section
-                in [
-                    "training_data",
-                    "evaluation_data_methodology_results_commisioning",
-                ]
-            ):
-                continue
-            if not _field_required_for_task(props, current_task):
-                continue
-
-            full_key = f"{section}_{key}"
-            ftype = (props.get("type") or "").lower()
-            if ftype == "image":
-                if not _has_required_image(full_key):
-                    missing.append((section, _label_for(props, key)))
-                continue
-
-            if is_empty(st.session_state.get(full_key)):
-                missing.append((section, _label_for(props, key)))
+    ss_get = st.session_state.get
+    plan = _validation_plan(schema, current_task)
+
+    for item, full_key in plan.plain_fields:
+        if is_empty(ss_get(full_key)):
+            missing.append(item)
+    for item, full_key in plan.image_fields:
+        if not _has_required_image(full_key):
+            missing.append(item)
     return missing
 
 
@@ -201,28 +319,38 @@ def validate_modalities_fields() -> list[MissingItem]:
     :rtype: list[MissingItem]
     """
     missing: list[MissingItem] = []
-    for modality, source in _modalities_from_state():
+    mods = _modalities_from_state()
+    if not mods:
+        return missing
+
+    # Slugs and the session getter are loop-invariant; resolve them once
+    # instead of per (modality, source) pair.
+    ss_get = st.session_state.get
+    evals = [
+        (name, name.replace(" ", "_"))
+        for name in ss_get("evaluation_forms", [])
+    ]
+
+    for modality, source in mods:
         clean = modality.strip().replace(" ", "_").lower()
+        suffix = f" ({modality} - {source})"
 
         # Training
         prefix_train = f"training_data_{clean}_{source}_"
         for field, label in DATA_INPUT_OUTPUT_TS.items():
-            if is_empty(st.session_state.get(f"{prefix_train}{field}")):
-                missing.append(
-                    ("training_data", f"{label} ({modality} - {source})"),
-                )
+            if is_empty(ss_get(prefix_train + field)):
+                missing.append(("training_data", label + suffix))
 
         # Evaluations
-        for name in st.session_state.get("evaluation_forms", []):
-            slug = name.replace(" ", "_")
-            prefix_eval = f"evaluation_{slug}_{clean}_"
+        for name, slug in evals:
+            prefix_eval = f"evaluation_{slug}_{clean}_{source}_"
+            eval_suffix = f"{suffix}(Eval: {name})"
             for field, label in DATA_INPUT_OUTPUT_TS.items():
-                full = f"{prefix_eval}{source}_{field}"
-                if is_empty(st.session_state.get(full)):
+                if is_empty(ss_get(prefix_eval + field)):
                     missing.append(
                         (
                             "evaluation_data_methodology_results_commisioning",
-                            f"{label} ({modality} - {source})(Eval: {name})",
+                            label + eval_suffix,
                         ),
                     )
     return missing
@@ -233,11 +361,11 @@ def _validate_metric_group(
     slug: str,
     name: str,
     metric_type: str,
-    eval_section: dict[str, dict[str, Any]],
+    required_fields: Sequence[tuple[str, str]],
     missing: list[MissingItem],
 ) -> None:
     """
-    Validate required fields inside one metric group by checking the evaluation section schema.
+    Validate required fields inside one metric group.
 
     :param prefix: The prefix for the metric fields.
     :type prefix: str
@@ -247,30 +375,27 @@ def _validate_metric_group(
     :type name: str
     :param metric_type: The type of the metric.
     :type metric_type: str
-    :param eval_section: The evaluation section schema.
-    :type eval_section: dict[str, dict[str, Any]]
+    :param required_fields: Precomputed (field key, label) pairs for the
+        group's required fields.
+    :type required_fields: Sequence[tuple[str, str]]
     :param missing: A list to collect missing items.
     :type missing: list[MissingItem]
-    """  # noqa: E501
+    """
     entry_list: Sequence[str] = st.session_state.get(
         f"{prefix}{metric_type}_list",
         [],
     )
     for metric_name in entry_list:
-        metric_prefix = f"evaluation_{slug}.{metric_name}"
+        metric_prefix = f"evaluation_{slug}.{metric_name}_"
         short = metric_name.split(" (")[0]
-        for field_key in EVALUATION_METRIC_FIELDS.get(metric_type, []):
-            props = eval_section.get(field_key)
-            if props and props.get("required", False):
-                full = f"{metric_prefix}_{field_key}"
-                if is_empty(st.session_state.get(full)):
-                    missing.append(
-                        (
-                            "evaluation_data_methodology_results_commisioning",
-                            f"{_label_for(props, field_key)} "
-                            f"(Metric: {short}, Eval: {name})",
-                        ),
-                    )
+        for field_key, label in required_fields:
+            if is_empty(st.session_state.get(metric_prefix + field_key)):
+                missing.append(
+                    (
+                        "evaluation_data_methodology_results_commisioning",
+                        f"{label} (Metric: {short}, Eval: {name})",
+                    ),
+                )
 
 
 def validate_evaluation_forms(
@@ -288,15 +413,11 @@ def validate_evaluation_forms(
     :rtype: list[MissingItem]
     """
     missing: list[MissingItem] = []
-    skip_fields = set(DATA_INPUT_OUTPUT_TS.keys())
-    eval_section = schema.get(
-        "evaluation_data_methodology_results_commisioning",
-        {},
-    )
-    metric_types = TASK_METRIC_MAP.get(current_task or "", [])
-    metric_keys = {
-        f for mt in metric_types for f in EVALUATION_METRIC_FIELDS.get(mt, [])
-    }
+    plan = _validation_plan(schema, current_task)
+    # Nothing to check per form (e.g. no task selected yet): skip the
+    # whole form walk instead of slugging each form for empty loops.
+    if not (plan.eval_required or plan.metric_types):
+        return missing
 
     for name in st.session_state.get("evaluation_forms", []):
         slug = name.replace(" ", "_")
@@ -305,32 +426,112 @@ def validate_evaluation_forms(
             st.session_state.get(f"{prefix}evaluated_same_as_approved", False),
         )
 
-        for key, props in eval_section.items():
-            if key in metric_keys or key in skip_fields:
+        for key, label in plan.eval_required:
+            if approved_same and key in _APPROVED_SAME_KEYS:
                 continue
-            if approved_same and key in {
-                "evaluated_by_name",
-                "evaluated_by_institution",
-                "evaluated_by_contact_email",
-            }:
+            if is_empty(st.session_state.get(prefix + key)):
+                missing.append(
+                    (
+                        "evaluation_data_methodology_results_commisioning",
+                        f"{label} (Eval: {name})",
+                    ),
+                )
+
+        for metric_type in plan.metric_types:
+            _validate_metric_group(
+                prefix,
+                slug,
+                name,
+                metric_type,
+                plan.metric_required[metric_type],
+                missing,
+            )
+    return missing
+
+
+def _validate_all(  # noqa: C901
+    schema: dict[str, dict[str, dict[str, Any]]],
+    current_task: str | None,
+) -> list[MissingItem]:
+    """
+    Run all validation checks in a single fused traversal.
+
+    The static and learning-architecture passes each walk their own data
+    once, so they are reused as-is; the modality and evaluation passes
+    both iterated the evaluation forms, so their per-form work (IO specs,
+    static fields, metric groups) is fused into one loop that slugs and
+    prefixes each form exactly once.
+
+    :param schema: The model card schema.
+    :type schema: dict[str, dict[str, dict[str, Any]]]
+    :param current_task: The current task identifier.
+    :type current_task: str | None
+    :return: A list of missing items.
+    :rtype: list[MissingItem]
+    """
+    missing = validate_static_fields(schema, current_task)
+    missing += validate_learning_architectures(schema)
+
+    ss_get = st.session_state.get
+    mods = [
+        (modality, source, modality.strip().replace(" ", "_").lower())
+        for modality, source in _modalities_from_state()
+    ]
+
+    # Training IO specs per modality.
+    for modality, source, clean in mods:
+        prefix_train = f"training_data_{clean}_{source}_"
+        suffix = f" ({modality} - {source})"
+        for field, label in DATA_INPUT_OUTPUT_TS.items():
+            if is_empty(ss_get(prefix_train + field)):
+                missing.append(("training_data", label + suffix))
+
+    plan = _validation_plan(schema, current_task)
+    # With no modality IO specs and an empty per-form plan, the form
+    # loop below can produce nothing; skip it entirely.
+    if not (mods or plan.eval_required or plan.metric_types):
+        return missing
+
+    for name in ss_get("evaluation_forms", []):
+        slug = name.replace(" ", "_")
+        prefix = f"evaluation_{slug}_"
+
+        # IO specs per modality for this evaluation.
+        for modality, source, clean in mods:
+            prefix_eval = f"{prefix}{clean}_{source}_"
+            eval_suffix = f" ({modality} - {source})(Eval: {name})"
+            for field, label in DATA_INPUT_OUTPUT_TS.items():
+                if is_empty(ss_get(prefix_eval + field)):
+                    missing.append(
+                        (
+                            "evaluation_data_methodology_results_commisioning",
+                            label + eval_suffix,
+                        ),
+                    )
+
+        # Static evaluation fields.
+        approved_same = bool(
+            ss_get(f"{prefix}evaluated_same_as_approved", False),
+        )
+        for key, label in plan.eval_required:
+            if approved_same and key in _APPROVED_SAME_KEYS:
                 continue
-            if _field_required_for_task(props, current_task) and is_empty(
-                st.session_state.get(f"{prefix}{key}"),
-            ):
+            if is_empty(ss_get(prefix + key)):
                 missing.append(
                     (
                         "evaluation_data_methodology_results_commisioning",
-                        f"{_label_for(props, key)} (Eval: {name})",
+                        f"{label} (Eval: {name})",
                     ),
                 )
 
-        for metric_type in metric_types:
+        # Metric groups.
+        for metric_type in plan.metric_types:
             _validate_metric_group(
                 prefix,
                 slug,
                 name,
                 metric_type,
-                eval_section,
+                plan.metric_required[metric_type],
                 missing,
             )
     return missing
@@ -350,9 +551,4 @@ def validate_required_fields(
     :return: A list of missing items.
     :rtype: list[MissingItem]
     """
-    return (
-        validate_static_fields(schema, current_task)
-        + validate_learning_architectures(schema)
-        + validate_modalities_fields()
-        + validate_evaluation_forms(schema, current_task)
-    )
+    return _validate_all(schema, current_task)
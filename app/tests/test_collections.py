@@ -1,35 +1,31 @@
 """
-Unit tests for app.core.collections: helpers to splice into OrderedDicts.
+Unit tests for app.core.collections: helpers to splice into dicts.
 Uses package imports to avoid any path issues or stdlib name clashes.
 """  # noqa: D205
 
 import importlib
-import sys
-from collections import OrderedDict
 from types import ModuleType
 
+import pytest
 
-def _coll() -> ModuleType:
-    """Import (or reload) app.core.collections for each test."""
-    name = "app.core.collections"
-    if name in sys.modules:
-        return importlib.reload(sys.modules[name])
-    return importlib.import_module(name)
 
+@pytest.fixture(scope="module")
+def coll() -> ModuleType:
+    """Import app.core.collections once for this module's tests."""
+    return importlib.import_module("app.core.collections")
 
-def test_insert_after_on_empty_creates_singleton() -> None:
-    """Test that inserting into an empty OrderedDict creates a singleton."""
-    m = _coll()
-    out = m.insert_after({}, "k", 1, "anything")
-    assert isinstance(out, OrderedDict)
+
+def test_insert_after_on_empty_creates_singleton(coll: ModuleType) -> None:
+    """Test that inserting into an empty dict creates a singleton."""
+    out = coll.insert_after({}, "k", 1, "anything")
+    assert isinstance(out, dict)
     assert list(out.items()) == [("k", 1)]
 
 
-def test_insert_after_inserts_after_existing_key() -> None:
+def test_insert_after_inserts_after_existing_key(coll: ModuleType) -> None:
     """Test that inserting after an existing key works correctly."""
-    m = _coll()
-    base = OrderedDict([("a", 1), ("b", 2), ("c", 3)])
-    out = m.insert_after(base, "x", 99, "b")
+    base = {"a": 1, "b": 2, "c": 3}
+    out = coll.insert_after(base, "x", 99, "b")
     assert list(out.items()) == [
         ("a", 1),
         ("b", 2),
@@ -38,20 +34,20 @@ def test_insert_after_inserts_after_existing_key() -> None:
     ]
 
 
-def test_insert_after_no_match_keeps_original() -> None:
+def test_insert_after_no_match_keeps_original(coll: ModuleType) -> None:
     """Test that inserting after a non-existent key keeps the original dict unchanged."""  # noqa: E501
-    m = _coll()
-    base = OrderedDict([("a", 1), ("b", 2)])
-    out = m.insert_after(base, "x", 99, "zzz")
+    base = {"a": 1, "b": 2}
+    out = coll.insert_after(base, "x", 99, "zzz")
     assert list(out.items()) == [("a", 1), ("b", 2)]
 
 
-def test_insert_dict_after_merges_all_pairs_after_key() -> None:
+def test_insert_dict_after_merges_all_pairs_after_key(
+    coll: ModuleType,
+) -> None:
     """Test that inserting a dict after a key merges all pairs correctly."""
-    m = _coll()
-    base = OrderedDict([("a", 1), ("b", 2), ("c", 3)])
-    ins = OrderedDict([("x", 10), ("y", 20)])
-    out = m.insert_dict_after(base, ins, "b")
+    base = {"a": 1, "b": 2, "c": 3}
+    ins = {"x": 10, "y": 20}
+    out = coll.insert_dict_after(base, ins, "b")
     assert list(out.items()) == [
         ("a", 1),
         ("b", 2),
@@ -61,10 +57,9 @@ def test_insert_dict_after_merges_all_pairs_after_key() -> None:
     ]
 
 
-def test_insert_dict_after_no_match_keeps_original() -> None:
+def test_insert_dict_after_no_match_keeps_original(coll: ModuleType) -> None:
     """Test that inserting a dict after a non-existent key keeps the original dict unchanged."""  # noqa: E501
-    m = _coll()
-    base = OrderedDict([("a", 1), ("b", 2)])
-    ins = OrderedDict([("x", 10)])
-    out = m.insert_dict_after(base, ins, "zzz")
+    base = {"a": 1, "b": 2}
+    ins = {"x": 10}
+    out = coll.insert_dict_after(base, ins, "zzz")
     assert list(out.items()) == [("a", 1), ("b", 2)]
@@ -19,8 +19,12 @@ class _StreamlitStub(ModuleType):
     session_state: MutableMapping[str, Any]
 
 
-def _du() -> ModuleType:
-    """Import (or reload) app.core.date_utils after the stub is in place."""
+@pytest.fixture(scope="module")
+def du() -> ModuleType:
+    """Install the streamlit stub once, then import app.core.date_utils."""
+    fake = _StreamlitStub("streamlit")
+    fake.session_state = {}
+    sys.modules["streamlit"] = fake
     name = "app.core.date_utils"
     if name in sys.modules:
         return importlib.reload(sys.modules[name])
@@ -28,52 +32,50 @@ def _du() -> ModuleType:
 
 
 @pytest.fixture(autouse=True)
-def mock_streamlit(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Provide a minimal streamlit stub with a session_state mapping."""
-    fake = _StreamlitStub("streamlit")
-    fake.session_state = {}
-    monkeypatch.setitem(sys.modules, "streamlit", fake)
+def _fresh_session_state(du: ModuleType) -> None:  # noqa: ARG001
+    """Reset the shared stub's session_state before each test."""
+    stub = cast("_StreamlitStub", sys.modules["streamlit"])
+    stub.session_state = {}
 
 
-def test_is_yyyymmdd_happy_path() -> None:
+def test_is_yyyymmdd_happy_path(du: ModuleType) -> None:
     """Accepts an 8-digit string."""
-    du = _du()
     assert du.is_yyyymmdd("20250131") is True
 
 
 @pytest.mark.parametrize(
     "val", [None, 12345678, "2025-0131", "2025013", "abc"],
 )
-def test_is_yyyymmdd_rejects_non_8_digit_strings(val: object) -> None:
+def test_is_yyyymmdd_rejects_non_8_digit_strings(
+    du: ModuleType,
+    val: object,
+) -> None:
     """Rejects non-strings and non-8-digit values."""
-    du = _du()
     assert du.is_yyyymmdd(val) is False
 
 
-def test_to_date_valid_roundtrip() -> None:
+def test_to_date_valid_roundtrip(du: ModuleType) -> None:
     """Parses a valid date string."""
-    du = _du()
     assert du.to_date("20250228") == date(2025, 2, 28)
 
 
 @pytest.mark.parametrize(
     "s", ["20250230", "20250010", "20251301", "abcdef12", "", "2025"],
 )
-def test_to_date_invalid_returns_none(s: str) -> None:
+def test_to_date_invalid_returns_none(du: ModuleType, s: str) -> None:
     """Invalid or malformed strings return None."""
-    du = _du()
     assert du.to_date(s) is None
 
 
-def test_to_date_handles_typeerror_gracefully() -> None:
+def test_to_date_handles_typeerror_gracefully(du: ModuleType) -> None:
     """None input is handled and returns None."""
-    du = _du()
     assert du.to_date(None) is None
 
 
-def test_set_safe_date_field_with_valid_date_sets_all_fields() -> None:
+def test_set_safe_date_field_with_valid_date_sets_all_fields(
+    du: ModuleType,
+) -> None:
     """Valid date updates all related session_state keys."""
-    du = _du()
     st = sys.modules["streamlit"]
     ss = cast("MutableMapping[str, Any]", st.session_state)
 
@@ -84,9 +86,10 @@ def test_set_safe_date_field_with_valid_date_sets_all_fields() -> None:
     assert ss["_start_date_widget"] == date(2024, 1, 15)
 
 
-def test_set_safe_date_field_with_invalid_date_sets_nones() -> None:
+def test_set_safe_date_field_with_invalid_date_sets_nones(
+    du: ModuleType,
+) -> None:
     """Invalid date sets the base and widget keys to None."""
-    du = _du()
     st = sys.modules["streamlit"]
     ss = cast("MutableMapping[str, Any]", st.session_state)
 
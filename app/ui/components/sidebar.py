@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import io
-import zipfile
+import importlib
 from pathlib import Path
 from typing import Any
 
@@ -18,23 +17,6 @@ from app.services.readme.builder import (
 from app.services.schema_loader import get_model_card_schema
 from app.services.serialization import parse_into_json
 from app.services.validation import validate_required_fields
-from app.ui.screens.sections.appendix import appendix_render
-from app.ui.screens.sections.card_metadata import card_metadata_render
-from app.ui.screens.sections.evaluation_data_mrc import (
-    evaluation_data_mrc_render,
-)
-from app.ui.screens.sections.model_basic_information import (
-    model_basic_information_render,
-)
-from app.ui.screens.sections.model_card_info import model_card_info_render
-from app.ui.screens.sections.other_considerations import (
-    other_considerations_render,
-)
-from app.ui.screens.sections.technical_specifications import (
-    technical_specifications_render,
-)
-from app.ui.screens.sections.training_data import training_data_render
-from app.ui.screens.sections.warnings import warnings_render
 from app.ui.utils.css import inject_css
 from app.ui.utils.typography import enlarge_tab_titles
 
@@ -57,52 +39,73 @@ def _inject_css() -> None:
 # Navigation helpers
 
 
+# Menu buttons in display order: label and the renderer's module/attr.
+# Renderers are resolved lazily when a button is clicked (same pattern
+# as the main page), so a rerun only pays for the section the user
+# actually navigates to.
+_SECTIONS_PKG = "app.ui.screens.sections"
+_MENU: tuple[tuple[str, str, str], ...] = (
+    (
+        "Card Metadata",
+        f"{_SECTIONS_PKG}.card_metadata",
+        "card_metadata_render",
+    ),
+    (
+        "Model Basic Information",
+        f"{_SECTIONS_PKG}.model_basic_information",
+        "model_basic_information_render",
+    ),
+    (
+        "Technical Specifications",
+        f"{_SECTIONS_PKG}.technical_specifications",
+        "technical_specifications_render",
+    ),
+    (
+        "Training Data Methodology and Information",
+        f"{_SECTIONS_PKG}.training_data",
+        "training_data_render",
+    ),
+    (
+        "Evaluation Data Methodology, Results and Commissioning",
+        f"{_SECTIONS_PKG}.evaluation_data_mrc",
+        "evaluation_data_mrc_render",
+    ),
+    (
+        "Other Considerations",
+        f"{_SECTIONS_PKG}.other_considerations",
+        "other_considerations_render",
+    ),
+    (
+        "Appendix",
+        f"{_SECTIONS_PKG}.appendix",
+        "appendix_render",
+    ),
+)
+
+
 def _render_menu() -> None:
     if st.button("About Model Cards", use_container_width=True):
+        from app.ui.screens.sections.model_card_info import (  # noqa: PLC0415
+            model_card_info_render,
+        )
+
         st.session_state.runpage = model_card_info_render
         st.rerun()
 
     st.markdown("## Menu")
 
-    if st.button("Card Metadata", use_container_width=True):
-        st.session_state.runpage = card_metadata_render
-        st.rerun()
-
-    if st.button("Model Basic Information", use_container_width=True):
-        st.session_state.runpage = model_basic_information_render
-        st.rerun()
-
-    if st.button("Technical Specifications", use_container_width=True):
-        st.session_state.runpage = technical_specifications_render
-        st.rerun()
-
-    if st.button(
-        "Training Data Methodology and Information",
-        use_container_width=True,
-    ):
-        st.session_state.runpage = training_data_render
-        st.rerun()
-
-    if st.button(
-        "Evaluation Data Methodology, Results and Commissioning",
-        use_container_width=True,
-    ):
-        st.session_state.runpage = evaluation_data_mrc_render
-        st.rerun()
-
-    if st.button("Other Considerations", use_container_width=True):
-        st.session_state.runpage = other_considerations_render
-        st.rerun()
-
-    if st.button("Appendix", use_container_width=True):
-        st.session_state.runpage = appendix_render
-        st.rerun()
+    for label, module_name, attr in _MENU:
+        if st.button(label, use_container_width=True):
+            module = importlib.import_module(module_name)
+            st.session_state.runpage = getattr(module, attr)
+            st.rerun()
 
     task = st.session_state.get("task", "Image-to-Image translation")
-    if validate_required_fields(
-        model_card_schema,
-        current_task=task,
-    ) and st.button("Warnings"):
+    if _missing_required(task) and st.button("Warnings"):
+        from app.ui.screens.sections.warnings import (  # noqa: PLC0415
+            warnings_render,
+        )
+
         st.session_state.runpage = warnings_render
         st.rerun()
 
@@ -117,8 +120,31 @@ def _error_if_format_invalid() -> bool:
     return False
 
 
-def _show_required_missing(task: str | None) -> None:
+def _missing_required(task: str | None) -> list[tuple[str, str]]:
+    """
+    Validate required fields at most once per sidebar render.
+
+    The menu and the download submit handlers both validate during the
+    same script run; the result is memoized on the per-render id bumped
+    by :func:`sidebar_render`, so every rerun still revalidates against
+    the live session state.
+
+    :param task: The current task identifier.
+    :type task: str | None
+    :return: The missing items for the current rerun.
+    :rtype: list[tuple[str, str]]
+    """
+    run_id = st.session_state.get("_sidebar_run_id")
+    cached = st.session_state.get("_missing_cache")
+    if cached is not None and cached[0] == (run_id, task):
+        return cached[1]
     missing = validate_required_fields(model_card_schema, current_task=task)
+    st.session_state["_missing_cache"] = ((run_id, task), missing)
+    return missing
+
+
+def _show_required_missing(task: str | None) -> None:
+    missing = _missing_required(task)
     if missing:
         st.error(
             "Some required fields are missing. Check the Warnings "
@@ -160,33 +186,28 @@ def _download_pdf_ui() -> None:
                     "model_card.pdf",
                     base_url=str(Path.cwd()),
                 )
+                # Read once here; the render branch below reruns with
+                # the banner visible and should not reopen the file.
+                st.session_state.generated_pdf_bytes = Path(
+                    str(pdf_path),
+                ).read_bytes()
                 st.session_state.download_ready_pdf = True
-                st.session_state.generated_pdf_path = pdf_path
             except (ImportError, OSError, RuntimeError) as e:
                 st.error(f"Failed to generate PDF: {e}")
                 st.session_state.download_ready_pdf = False
 
     if st.session_state.get("download_ready_pdf"):
-        pdf_path_raw = st.session_state.get(
-            "generated_pdf_path",
-            "model_card.pdf",
+        st.download_button(
+            "Your download is ready — click here (PDF)",
+            st.session_state.get("generated_pdf_bytes", b""),
+            file_name="model_card.pdf",
+            use_container_width=True,
+            key="btn_download_pdf",
         )
-        pdf_path_obj = Path(str(pdf_path_raw))
-        with pdf_path_obj.open("rb") as pdf_file:
-            st.download_button(
-                "Your download is ready — click here (PDF)",
-                pdf_file,
-                file_name="model_card.pdf",
-                use_container_width=True,
-                key="btn_download_pdf",
-            )
         st.session_state.download_ready_pdf = False
 
 
 def _download_md_ui() -> None:
-    def _parse_into_markdown() -> str:
-        return render_full_model_card_md()
-
     with st.form("form_download_md"):
         if st.form_submit_button("Download Model Card as `.md`"):
             if _error_if_format_invalid():
@@ -196,7 +217,7 @@ def _download_md_ui() -> None:
 
     if st.session_state.get("download_ready_md"):
         try:
-            md_text = _parse_into_markdown()
+            md_text = render_full_model_card_md()
             with st.expander("Preview (.md)", expanded=False):
                 st.code(md_text, language="markdown")
             st.download_button(
@@ -212,9 +233,94 @@ def _download_md_ui() -> None:
             st.session_state.download_ready_md = False
 
 
+# Archives up to this size are built in RAM; larger ones spill to disk
+# instead of holding the whole ZIP in memory.
+_ZIP_SPOOL_MAX_BYTES = 16 << 20
+
+# Upload types that are already compressed: deflating them again burns
+# CPU on the largest files for no size gain, so they are stored as-is.
+_ZIP_STORED_EXTS = frozenset({
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".pdf",
+    ".docx",
+    ".pptx",
+    ".xlsx",
+    ".gz",
+    ".zip",
+})
+
+
 def _get_uploaded_paths() -> list[str]:
+    # The stat calls are memoized on the registry contents: uploads and
+    # deletes go through the registry, so the filtered list only needs
+    # rebuilding when the path set itself changes. Files that vanish
+    # behind the app's back are still caught per entry by the ZIP
+    # builder.
     paths = st.session_state.get("all_uploaded_paths", set())
-    return [p for p in list(paths) if isinstance(p, str) and Path(p).exists()]
+    key = frozenset(paths)
+    cached = st.session_state.get("_valid_paths_cache")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    out = [p for p in key if isinstance(p, str) and Path(p).is_file()]
+    st.session_state["_valid_paths_cache"] = (key, out)
+    return out
+
+
+def _build_files_zip(
+    files: list[str],
+    card_content: str | None = None,
+) -> bytes:
+    """
+    Write the given files (and optionally the card JSON) into a ZIP.
+
+    The archive is assembled in a spooled temporary file so large
+    builds spill to disk, then returned as bytes — the only binary
+    form st.download_button accepts.
+
+    :param files: Paths of the files to archive.
+    :type files: list[str]
+    :param card_content: Model card JSON to include, defaults to None.
+    :type card_content: str | None, optional
+    :return: The archive contents.
+    :rtype: bytes
+    """
+    import tempfile  # noqa: PLC0415
+    import zipfile  # noqa: PLC0415
+
+    buffer = tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX_BYTES)
+    prefix = "" if card_content is None else "files/"
+    with zipfile.ZipFile(
+        buffer,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+    ) as zf:
+        if card_content is not None:
+            zf.writestr("model_card.json", card_content)
+        for fpath in files:
+            path = Path(fpath)
+            compress_type = (
+                zipfile.ZIP_STORED
+                if path.suffix.lower() in _ZIP_STORED_EXTS
+                else zipfile.ZIP_DEFLATED
+            )
+            try:
+                zf.write(
+                    fpath,
+                    arcname=prefix + path.name,
+                    compress_type=compress_type,
+                )
+            except OSError:
+                st.warning(
+                    f"Could not add (missing or not a file): {fpath}",
+                )
+    buffer.seek(0)
+    data = buffer.read()
+    buffer.close()
+    return data
 
 
 def _download_files_zip_only_ui() -> None:
@@ -231,38 +337,14 @@ def _download_files_zip_only_ui() -> None:
         if not files:
             st.warning("No uploaded files to download.")
         else:
-            buffer = io.BytesIO()
-            valid_files: list[str] = []
-            for fpath in files:
-                p = Path(fpath)
-                if p.exists() and p.is_file():
-                    valid_files.append(fpath)
-                else:
-                    st.warning(
-                        f"Could not add (missing or not a file): {fpath}",
-                    )
-            if not valid_files:
-                st.warning(
-                    "No valid uploaded files to include in the ZIP.",
-                )
-            else:
-                with zipfile.ZipFile(
-                    buffer,
-                    "w",
-                    compression=zipfile.ZIP_DEFLATED,
-                ) as zf:
-                    for fpath in valid_files:
-                        arcname = Path(fpath).name
-                        zf.write(fpath, arcname=arcname)
-                buffer.seek(0)
-                st.download_button(
-                    label="Download all files (ZIP)",
-                    data=buffer,
-                    file_name="uploaded_files.zip",
-                    mime="application/zip",
-                    key="btn_download_files_zip",
-                    use_container_width=True,
-                )
+            st.download_button(
+                label="Download all files (ZIP)",
+                data=_build_files_zip(files),
+                file_name="uploaded_files.zip",
+                mime="application/zip",
+                key="btn_download_files_zip",
+                use_container_width=True,
+            )
         st.session_state.download_files_ready = False
 
 
@@ -285,28 +367,11 @@ def _download_zip_json_plus_files_ui() -> None:
         if not files:
             st.warning("No uploaded files to include in the ZIP.")
         else:
-            card_content = parse_into_json(SCHEMA)
-            buffer = io.BytesIO()
-            valid_files_zip: list[str] = []
-            for fpath in files:
-                p = Path(fpath)
-                if p.exists() and p.is_file():
-                    valid_files_zip.append(fpath)
-                else:
-                    st.warning(
-                        f"Could not add (missing or not a file): {fpath}",
-                    )
             try:
-                with zipfile.ZipFile(
-                    buffer,
-                    "w",
-                    compression=zipfile.ZIP_DEFLATED,
-                ) as zf:
-                    zf.writestr("model_card.json", card_content)
-                    for fpath in valid_files_zip:
-                        arcname = f"files/{Path(fpath).name}"
-                        zf.write(fpath, arcname=arcname)
-                buffer.seek(0)
+                buffer = _build_files_zip(
+                    files,
+                    card_content=parse_into_json(SCHEMA),
+                )
                 st.download_button(
                     "Your download is ready — click here (ZIP)",
                     data=buffer,
@@ -333,13 +398,27 @@ def _local_downloads_tab() -> None:
 # README tab helpers
 
 
+def _set_readme_text(text: str | None) -> None:
+    """
+    Store the README text together with its UTF-8 bytes.
+
+    The preview's download button re-renders on every rerun; encoding
+    once here means those reruns hand Streamlit the stored bytes.
+
+    :param text: The README content, or None to clear it.
+    :type text: str | None
+    """
+    st.session_state.last_readme_text = text
+    st.session_state["_last_readme_bytes"] = (
+        None if text is None else text.encode("utf-8")
+    )
+
+
 def _readme_generate_form() -> None:
     with st.form("form_generate_readme"):
         if st.form_submit_button("Generate README.md"):
             try:
-                _ = parse_into_json(SCHEMA)
-                generated = render_hf_readme()
-                st.session_state.last_readme_text = generated
+                _set_readme_text(render_hf_readme())
                 st.success(
                     "README built successfully. Use the download button "
                     "below.",
@@ -350,7 +429,7 @@ def _readme_generate_form() -> None:
                 OSError,
                 TypeError,
             ) as e:
-                st.session_state.last_readme_text = None
+                _set_readme_text(None)
                 st.error(f"Could not build README: {e}")
 
 
@@ -359,7 +438,7 @@ def _readme_download_preview() -> None:
         return
     st.download_button(
         "Download README.md",
-        data=st.session_state.last_readme_text.encode("utf-8"),
+        data=st.session_state["_last_readme_bytes"],
         file_name="README.md",
         mime="text/markdown",
         use_container_width=True,
@@ -402,7 +481,7 @@ def _hub_push_form() -> None:
         return
     try:
         if not st.session_state.get("last_readme_text"):
-            st.session_state.last_readme_text = render_hf_readme()
+            _set_readme_text(render_hf_readme())
         tmp_path = "README.md"
         with open(tmp_path, "w", encoding="utf-8") as f:  # noqa: PTH123
             f.write(st.session_state.last_readme_text)
@@ -421,8 +500,6 @@ def _hub_push_form() -> None:
 
 
 def _readme_tab() -> None:
-    task = st.session_state.get("task", "Image-to-Image translation")
-    _ = validate_required_fields(model_card_schema, current_task=task)
     if "last_readme_text" not in st.session_state:
         st.session_state.last_readme_text = None
     _readme_generate_form()
@@ -432,6 +509,9 @@ def _readme_tab() -> None:
 
 def sidebar_render() -> None:
     """Render the sidebar for the Streamlit app."""
+    st.session_state["_sidebar_run_id"] = (
+        st.session_state.get("_sidebar_run_id", 0) + 1
+    )
     with st.sidebar:
         _inject_css()
         _render_menu()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from pathlib import Path
 
 import streamlit as st
@@ -20,6 +21,27 @@ _PREVIEW_IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".gif"}
 _PREVIEW_OTHER_EXTS = set(_PREVIEW_LANG_BY_EXT) | {".pdf"}
 
 
+@lru_cache(maxsize=8)
+def _pdf_b64(path_str: str, _mtime_ns: int, _size: int) -> str:
+    """
+    Read and base64-encode a PDF, cached per (path, mtime, size).
+
+    The extra arguments only key the cache: an overwritten file changes
+    its stat signature and gets re-encoded, while an unchanged preview
+    costs one stat per rerun instead of a full read and encode.
+
+    :param path_str: Filesystem path to the PDF.
+    :type path_str: str
+    :param _mtime_ns: Modification time of the file, in nanoseconds.
+    :type _mtime_ns: int
+    :param _size: Size of the file in bytes.
+    :type _size: int
+    :return: The base64-encoded file content.
+    :rtype: str
+    """
+    return base64.b64encode(Path(path_str).read_bytes()).decode("utf-8")
+
+
 def preview_file(file_path: str) -> bool | None:
     """
     Render a file preview in Streamlit based on file extension.
@@ -45,8 +67,8 @@ def preview_file(file_path: str) -> bool | None:
             st.image(str(path), use_container_width=True)
             return True
         if suffix == ".pdf":
-            with path.open("rb") as f:
-                base64_pdf = base64.b64encode(f.read()).decode("utf-8")
+            stat = path.stat()
+            base64_pdf = _pdf_b64(str(path), stat.st_mtime_ns, stat.st_size)
             html = (
                 f'<iframe src="data:application/pdf;base64,{base64_pdf}" '
                 'width="100%" height="500px"></iframe>'
@@ -1,39 +1,13 @@
 """Module with utility functions for Streamlit app UI components."""
 
 import re
+from functools import lru_cache
 
 import streamlit as st
 
-
-def create_helpicon(
-    label: str,
-    description: str,
-    field_format: str,
-    example: str,
-    required: bool = False,  # noqa: FBT001, FBT002
-) -> None:
-    """
-    Create a help icon with a tooltip for a form field.
-
-    :param label: The label for the form field.
-    :type label: str
-    :param description: A description of the form field.
-    :type description: str
-    :param field_format: The expected format for the form field.
-    :type field_format: str
-    :param example: An example of the form field input.
-    :type example: str
-    :param required: Whether the form field is required, defaults to False
-    :type required: bool, optional
-    """
-    required_tag: str = (
-        "<span style='color: black; font-size: 1.2em;'>*</span>"
-        if required
-        else ""
-    )
-
-    st.markdown(
-        """
+# Static tooltip CSS, sent verbatim for every help icon; kept as one
+# module constant so each call reuses the same string object.
+_TOOLTIP_CSS = """
         <style>
         .tooltip-inline {
             display: inline-block;
@@ -66,10 +40,38 @@ def create_helpicon(
         }
         .tooltip-inline:hover .tooltiptext { visibility: visible; }
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
+
+
+def create_helpicon(
+    label: str,
+    description: str,
+    field_format: str,
+    example: str,
+    required: bool = False,  # noqa: FBT001, FBT002
+) -> None:
+    """
+    Create a help icon with a tooltip for a form field.
+
+    :param label: The label for the form field.
+    :type label: str
+    :param description: A description of the form field.
+    :type description: str
+    :param field_format: The expected format for the form field.
+    :type field_format: str
+    :param example: An example of the form field input.
+    :type example: str
+    :param required: Whether the form field is required, defaults to False
+    :type required: bool, optional
+    """
+    required_tag: str = (
+        "<span style='color: black; font-size: 1.2em;'>*</span>"
+        if required
+        else ""
     )
 
+    st.markdown(_TOOLTIP_CSS, unsafe_allow_html=True)
+
     tooltip_html: str = f"""
     <div style='margin-bottom: 0px; font-weight: 500; font-size: 0.98em;'>
         {label} {required_tag}
@@ -298,24 +300,21 @@ def strip_brackets(text: str) -> str:
     return re.sub(r"\s*\(.*?\)", "", text).strip()
 
 
-def enlarge_tab_titles(
-    font_px: int,
-    underline_px: int = 4,
-    pad_y: int = 6,
-) -> None:
+@lru_cache(maxsize=4)
+def _tab_title_css(font_px: int, underline_px: int, pad_y: int) -> str:
     """
-    Enlarge the font size and padding of tab titles in the Streamlit app.
+    Build the tab-title style block (cached per size combination).
 
     :param font_px: The font size of the tab titles.
     :type font_px: int
-    :param underline_px: The height of the underline for the active
-        tab, defaults to 4.
-    :type underline_px: int, optional
-    :param pad_y: The vertical padding of the tab titles, defaults to 6.
-    :type pad_y: int, optional
+    :param underline_px: The height of the underline for the active tab.
+    :type underline_px: int
+    :param pad_y: The vertical padding of the tab titles.
+    :type pad_y: int
+    :return: The formatted ``<style>`` block.
+    :rtype: str
     """
-    st.markdown(
-        f"""
+    return f"""
     <style>
       [data-testid="stTabs"] button[role="tab"] {{
         font-size: {font_px}px !important;
@@ -335,6 +334,26 @@ def enlarge_tab_titles(
         padding-bottom: {pad_y}px !important;
       }}
     </style>
-    """,
+    """
+
+
+def enlarge_tab_titles(
+    font_px: int,
+    underline_px: int = 4,
+    pad_y: int = 6,
+) -> None:
+    """
+    Enlarge the font size and padding of tab titles in the Streamlit app.
+
+    :param font_px: The font size of the tab titles.
+    :type font_px: int
+    :param underline_px: The height of the underline for the active
+        tab, defaults to 4.
+    :type underline_px: int, optional
+    :param pad_y: The vertical padding of the tab titles, defaults to 6.
+    :type pad_y: int, optional
+    """
+    st.markdown(
+        _tab_title_css(font_px, underline_px, pad_y),
         unsafe_allow_html=True,
     )